@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.charts as charts
+from bench.synthetic import backup_frames
+from utils.backup_loader import get_last_backups
+from utils.data_processing import process_data
+
+
+CHARTS = ['size', 'backup_speed', 'size_obj', 'backup_speed_obj']
+
+
+def figure_size(name, data):
+    start = time.perf_counter()
+    figure = charts.generate_chart(name, data)
+    points = sum(len(trace.x) for trace in figure.data)
+    size = len(figure.to_json())
+
+    return points, size, time.perf_counter() - start
+
+
+def without_downsampling():
+    downsample, render_mode = charts.downsample, charts.render_mode
+    charts.downsample, charts.render_mode = lambda df, *args, **kwargs: df, lambda df: 'auto'
+
+    return lambda: setattr(charts, 'downsample', downsample) or setattr(charts, 'render_mode', render_mode)
+
+
+def main():
+    arguments = argparse.ArgumentParser(description="Compare figure JSON size of the per-row time-series charts with and without downsampling.")
+    arguments.add_argument('--days', type=int, nargs='+', default=[60, 120])
+    arguments.add_argument('--jobs', type=int, default=20)
+    arguments.add_argument('--objects', type=int, default=50)
+    args = arguments.parse_args()
+
+    print(f"{'chart':>17} {'rows':>9} {'points':>17} {'JSON MB':>15} {'build s':>13}")
+
+    for days in args.days:
+        backup, obj = backup_frames(days, args.jobs, args.objects, max_retries=0)
+        backup, obj, _, _ = process_data(backup, obj, *get_last_backups(backup, obj))
+        data = {'backup': backup, 'obj': obj}
+
+        for name in CHARTS:
+            restore = without_downsampling()
+            try:
+                before = figure_size(name, data)
+            finally:
+                restore()
+            after = figure_size(name, data)
+
+            print(f"{name:>17} {len(data[charts.CHARTS[name][1]]):>9} {before[0]:>8} -> {after[0]:>6} "
+                  f"{before[1] / 2**20:>6.1f} -> {after[1] / 2**20:>5.1f} {before[2]:>5.1f} -> {after[2]:>5.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+import random
+import argparse
+import datetime as dt
+from dateutil import parser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.synthetic import MONTHS, WEEKDAYS
+from bench.bench_report_parse import replace_months
+from utils.date_parser import parse_header_date
+
+
+def headers(count, distinct, seed=0):
+    random.seed(seed)
+    start = dt.datetime(2020, 1, 1)
+    moments = [start + dt.timedelta(seconds=random.randrange(5 * 365 * 24 * 3600)) for _ in range(distinct)]
+    texts = [f"{WEEKDAYS[moment.weekday()]}, {moment.day} {MONTHS[moment.month - 1]} {moment.year} {moment:%H:%M:%S}" for moment in moments]
+
+    return [random.choice(texts) for _ in range(count)] if count > distinct else texts
+
+
+def dateutil_path(text):
+    return parser.parse(replace_months(text.split(',')[-1].strip()), dayfirst=True)
+
+
+def timed(function, texts):
+    start = time.perf_counter()
+    results = [function(text) for text in texts]
+    return time.perf_counter() - start, results
+
+
+def main():
+    arguments = argparse.ArgumentParser(description="Time the month-name header parser against replace_months + dateutil.")
+    arguments.add_argument('--distinct', type=int, default=20_000)
+    arguments.add_argument('--repeated', type=int, default=18_000, help="headers drawn from a pool of 10%% distinct values")
+    args = arguments.parse_args()
+
+    print(f"{'headers':>8} {'distinct':>9} {'dateutil':>9} {'parser':>8} {'speedup':>8}  equal")
+
+    for count, distinct in [(args.distinct, args.distinct), (args.repeated, args.repeated // 10)]:
+        texts = headers(count, distinct)
+
+        old, expected = timed(dateutil_path, texts)
+        parse_header_date.cache_clear()
+        new, results = timed(parse_header_date, texts)
+
+        print(f"{count:>8} {distinct:>9} {old:>8.3f}s {new:>7.3f}s {old / new:>7.1f}x  {results == expected}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.synthetic import backup_frames
+from tests.test_backup_loader import legacy_get_last_backups
+from utils.backup_loader import get_last_backups
+
+
+JOBS = 20
+OBJECTS = 10
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    arguments = argparse.ArgumentParser(description="Time get_last_backups from 1k to 1M object rows, against the old row loop on the smaller sizes.")
+    arguments.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    arguments.add_argument('--legacy-max', type=int, default=20_000, help="largest size to also time the old loop on (it is quadratic)")
+    args = arguments.parse_args()
+
+    print(f"{'object rows':>12} {'backup rows':>12} {'vectorized':>11} {'old loop':>10}")
+
+    for rows in args.rows:
+        days = max(rows // (JOBS * OBJECTS), 1)
+        backup, obj = backup_frames(days, JOBS, OBJECTS)
+        obj = obj.iloc[:rows]
+
+        vectorized = timed(get_last_backups, backup, obj)
+        legacy = f"{timed(legacy_get_last_backups, backup, obj):>9.3f}s" if rows <= args.legacy_max else f"{'-':>10}"
+
+        print(f"{len(obj):>12} {len(backup):>12} {vectorized:>10.3f}s {legacy}")
+
+
+if __name__ == '__main__':
+    main()
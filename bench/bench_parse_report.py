@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WORK_DIR = tempfile.mkdtemp(prefix='bench_parse_report_')
+os.environ['REPORT_CACHE_DIR'] = os.path.join(WORK_DIR, 'cache')
+
+from bench.synthetic import make_report
+from utils.report_cache import clear_cache
+from utils.report_loader import parse_report
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    arguments = argparse.ArgumentParser(description="Time headless parse_report on synthetic workbooks, cold and from the report cache.")
+    arguments.add_argument('--days', type=int, default=30)
+    arguments.add_argument('--jobs', type=int, nargs='+', default=[10, 50, 100])
+    arguments.add_argument('--objects', type=int, default=10)
+    arguments.add_argument('--sheets', type=int, default=2)
+    arguments.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = arguments.parse_args()
+
+    print(f"{'backup rows':>12} {'object rows':>12} {'serial':>8} {f'{args.workers} workers':>10} {'cached':>8}")
+
+    try:
+        for jobs in args.jobs:
+            path = os.path.join(WORK_DIR, f'report_{jobs}.xlsx')
+            make_report(path, args.days, jobs, args.objects, args.sheets)
+
+            clear_cache()
+            serial, (backup, obj, execution, errors) = timed(parse_report, path)
+
+            clear_cache()
+            parallel, _ = timed(parse_report, path, args.workers)
+            cached, _ = timed(parse_report, path)
+
+            print(f"{len(backup):>12} {len(obj):>12} {serial:>7.2f}s {parallel:>9.2f}s {cached:>7.2f}s")
+    finally:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
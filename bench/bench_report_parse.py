@@ -0,0 +1,131 @@
+import os
+import re
+import sys
+import time
+import argparse
+from dateutil import parser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.synthetic import report_rows
+from utils.date_parser import parse_header_date
+from utils.report_parser import parse_rows
+
+
+MONTHS_MAP = {
+    'stycznia': 'January', 'styczeń': 'January', 'lutego': 'February', 'luty': 'February',
+    'marca': 'March', 'marzec': 'March', 'kwietnia': 'April', 'kwiecień': 'April',
+    'maja': 'May', 'maj': 'May', 'czerwca': 'June', 'czerwiec': 'June',
+    'lipca': 'July', 'lipiec': 'July', 'sierpnia': 'August', 'sierpień': 'August',
+    'września': 'September', 'wrzesień': 'September', 'października': 'October', 'październik': 'October',
+    'listopada': 'November', 'listopad': 'November', 'grudnia': 'December', 'grudzień': 'December'
+}
+
+
+def replace_months(date_str):
+    for key, value in MONTHS_MAP.items():
+        date_str = date_str.replace(key, value)
+    return date_str
+
+
+# The two row scans that report_summary and get_backup_execution ran before
+# they were fused into parse_rows, reduced to the classification loops.
+def summary_scan(rows):
+    jobs, details, errors = [], [], []
+    entry, details_section = {}, False
+
+    for row in rows:
+        if row[0] and "Backup job" in row[0]:
+            details_section = False
+            entry = {'Backup Job': None, 'Status': row[8]}
+            if "Retry" in row[0]:
+                match = re.search(r'Backup job: (.*?) \(Retry \d+\)', row[0])
+                if match:
+                    entry['Backup Job'] = match.group(1)
+            else:
+                entry['Backup Job'] = row[0].split("Backup job: ")[1].strip()
+        elif row[0] in ["Success", "Warning", "Error"] and not details_section:
+            entry[row[0]] = row[1]
+            entry.update(dict(zip({'Success': ('Start Time', 'Total Size', 'Backup Size'),
+                                   'Warning': ('End Time', 'Data Read', 'Dedupe'),
+                                   'Error': ('Duration', 'Transferred', 'Compression')}[row[0]], row[3:8:2])))
+        elif row[0] and re.search(r"\d{1,2}:\d{2}:\d{2}", row[0]):
+            try:
+                entry['Date'] = parser.parse(replace_months(row[0].split(',')[-1].strip()), yearfirst=True).date()
+                jobs.append(entry)
+            except ValueError as e:
+                errors.append(e)
+        elif row[0] and row[0] == "Details":
+            details_section = True
+        elif row[0] and details_section and row[0] != 'Name':
+            details.append({'Date': entry['Date'], 'Backup Job': entry['Backup Job'], 'Object': row[0], 'Status': row[1],
+                            'Start Time': row[2], 'End Time': row[3], 'Size': row[4], 'Read': row[5],
+                            'Transferred': row[6], 'Duration': row[7]})
+
+    return jobs, details, errors
+
+
+def execution_scan(rows):
+    executions = []
+    job, entry, retry_num = None, None, None
+
+    for row in rows:
+        if row[0] and "Backup job" in row[0]:
+            if "Retry" in row[0]:
+                match = re.search(r'Backup job: (.*?) \(Retry (\d+)\)', row[0])
+                if match:
+                    job, retry_num = match.group(1), int(match.group(2))
+            else:
+                job = row[0].split("Backup job: ")[1].strip()
+            entry = {'Month': None, 'Date': None, 'Week Number': None, 'Day of Week': None, 'Backup Job': job, 'Status': row[8]}
+        elif row[0] and re.search(r"\d{1,2}:\d{2}:\d{2}", row[0]):
+            try:
+                parsed_date = parser.parse(replace_months(row[0].split(',')[-1].strip()), dayfirst=True)
+            except ValueError:
+                continue
+            month_first_day = parsed_date.replace(day=1)
+            entry['Month'] = parsed_date.month
+            entry['Week Number'] = ((parsed_date - month_first_day).days + month_first_day.weekday()) // 7 + 1
+            entry['Day of Week'] = parsed_date.strftime('%A')
+            entry['Date'] = parsed_date.date()
+        elif row[3] and row[2] == "Start time" and row[3] != "End time":
+            entry['Backup' if retry_num is None else f'Backup (Retry {retry_num})'] = row[3]
+            retry_num = None
+            executions.append(entry)
+            entry = {'Month': None, 'Date': None, 'Week Number': None, 'Day of Week': None, 'Backup Job': job, 'Status': None}
+
+    return executions
+
+
+def best_of(repeat, function, *args):
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main():
+    arguments = argparse.ArgumentParser(description="Time the fused report row classification against the two separate scans it replaced.")
+    arguments.add_argument('--days', type=int, default=30)
+    arguments.add_argument('--jobs', type=int, nargs='+', default=[10, 100, 400])
+    arguments.add_argument('--objects', type=int, default=10)
+    arguments.add_argument('--repeat', type=int, default=3)
+    args = arguments.parse_args()
+
+    print(f"{'rows':>9} {'two scans':>10} {'fused':>8} {'speedup':>8}")
+
+    for jobs in args.jobs:
+        rows = report_rows(args.days, jobs, args.objects)
+
+        two_scans = best_of(args.repeat, lambda: (summary_scan(rows), execution_scan(rows)))
+        fused = best_of(args.repeat, lambda: (parse_header_date.cache_clear(), parse_rows(rows)))
+
+        print(f"{len(rows):>9} {two_scans:>9.3f}s {fused:>7.3f}s {two_scans / fused:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
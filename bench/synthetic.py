@@ -0,0 +1,115 @@
+import random
+import datetime as dt
+import pandas as pd
+from openpyxl import Workbook
+from utils.schema import BACKUP_SCHEMA, OBJECT_SCHEMA, apply_schema
+
+
+MONTHS = ['stycznia', 'lutego', 'marca', 'kwietnia', 'maja', 'czerwca', 'lipca', 'sierpnia', 'września', 'października', 'listopada', 'grudnia']
+WEEKDAYS = ['poniedziałek', 'wtorek', 'środa', 'czwartek', 'piątek', 'sobota', 'niedziela']
+STATUSES = ['Success', 'Warning', 'Error']
+FOOTER = 'Veeam Backup & Replication 12'
+
+
+def size():
+    return f"{random.uniform(1, 900):.1f} {random.choice(['KB', 'MB', 'GB', 'TB'])}".replace('.', ',')
+
+
+def ratio():
+    return f"{random.uniform(1, 3):.1f}x".replace('.', ',')
+
+
+def job_block(job, day, retry, objects):
+    start = dt.datetime.combine(day, dt.time(random.randint(0, 23), random.randint(0, 59), random.randint(0, 59)))
+    duration = dt.timedelta(minutes=random.randint(1, 300))
+    end = start + duration
+    status = random.choices(STATUSES, [8, 1, 1])[0]
+    title = f"Backup job: {job}" + (f" (Retry {retry})" if retry else "")
+
+    rows = [
+        (title, None, None, None, None, None, None, None, status),
+        (f"{WEEKDAYS[day.weekday()]}, {day.day} {MONTHS[day.month - 1]} {day.year} {start:%H:%M:%S}",) + (None,) * 8,
+        ('Success', len(objects), 'Start time', start.time(), 'Total size', size(), 'Backup size', size(), None),
+        ('Warning', 0, 'End time', end.time(), 'Data read', size(), 'Dedupe', ratio(), None),
+        ('Error', 0, 'Duration', str(duration), 'Transferred', size(), 'Compression', ratio(), None),
+        ('Details',) + (None,) * 8,
+        ('Name', 'Status', 'Start time', 'End time', 'Size', 'Read', 'Transferred', 'Duration', 'Details')
+    ]
+
+    for obj in objects:
+        rows.append((obj, random.choices(STATUSES, [8, 1, 1])[0], start.time(), end.time(), size(), size(), size(), str(duration), None))
+
+    return status, rows
+
+
+def report_rows(days=30, jobs=10, objects=5, start=dt.date(2024, 5, 1), seed=0):
+    random.seed(seed)
+    rows = []
+
+    for offset in range(days):
+        day = start + dt.timedelta(days=offset)
+
+        for job in range(jobs):
+            names = [f"VM-{job}-{obj}" for obj in range(objects)]
+            status, block = job_block(f"Job {job}", day, None, names)
+            rows += block
+
+            retry = 1
+            while status == 'Error' and retry <= 3:
+                status, block = job_block(f"Job {job}", day, retry, names)
+                rows += block
+                retry += 1
+
+    return rows
+
+
+def make_report(path, days=30, jobs=10, objects=5, sheets=1, start=dt.date(2024, 5, 1), seed=0):
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+
+    for sheet in range(sheets):
+        worksheet = workbook.create_sheet(f"Sheet{sheet}")
+
+        for row in report_rows(days, jobs, objects, start + dt.timedelta(days=sheet * days), seed + sheet):
+            worksheet.append(row)
+
+        worksheet.append((FOOTER,) + (None,) * 8)
+
+    workbook.save(path)
+
+
+def backup_frames(days=10, jobs=5, objects=4, max_retries=2, start=dt.date(2024, 5, 1), seed=0):
+    random.seed(seed)
+    backups, details = [], []
+
+    for offset in range(days):
+        day = pd.Timestamp(start + dt.timedelta(days=offset))
+
+        for job in range(jobs):
+            names = [f"VM-{job}-{obj}" for obj in range(objects)]
+            runs = sorted(random.sample(range(24 * 3600), random.randint(1, max_retries + 1)))
+
+            for run, seconds in enumerate(runs):
+                start_time = f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+                backed_up = names if run == 0 else random.sample(names, random.randint(1, len(names)))
+                status = random.choice(STATUSES)
+
+                backups.append({
+                    'Date': day, 'Backup Job': f"Job {job}", 'Status': status,
+                    'Success': len(backed_up), 'Warning': 0, 'Error': 0,
+                    'Start Time': start_time, 'End Time': start_time, 'Duration': '0:10:00',
+                    'Total Size': size(), 'Backup Size': size(), 'Data Read': size(), 'Transferred': size(),
+                    'Dedupe': ratio(), 'Compression': ratio()
+                })
+
+                for obj in backed_up:
+                    details.append({
+                        'Date': day, 'Backup Job': f"Job {job}", 'Object': obj, 'Status': random.choice(STATUSES),
+                        'Start Time': start_time, 'End Time': start_time, 'Duration': '0:10:00',
+                        'Size': size(), 'Read': size(), 'Transferred': size()
+                    })
+
+    backup = apply_schema(pd.DataFrame(backups), BACKUP_SCHEMA).sort_values(['Date', 'Start Time'], kind='stable', ignore_index=True)
+    obj = apply_schema(pd.DataFrame(details), OBJECT_SCHEMA).sort_values(['Date', 'Start Time'], kind='stable', ignore_index=True)
+
+    return backup, obj
@@ -1,52 +1,41 @@
 import streamlit as st
-import pandas as pd
-from openpyxl import load_workbook
 import locale
-from utils.backup_loader import report_summary, get_job_objects, combine
-from utils.execution_loader import get_backup_execution, merge_retry_rows, combine_exec
+from utils.report_cache import cache_key
+from utils.report_store import ingest_reports, open_store, store_changed, load_backups
+from utils.report_warehouse import clear_warehouse
+from utils.schema import format_times
+
+
+def use_store(store):
+    st.session_state['report_store'] = store
+
+    st.session_state['uploaded_execution'] = store['execution']
+    st.session_state['uploaded_last_backup'] = store['last_backup']
+    st.session_state['uploaded_last_obj'] = store['last_obj']
+
+    st.session_state['job_obj'] = store['job_obj']
+
+    st.session_state['min_date'] = store['min_date'].date()
+    st.session_state['max_date'] = store['max_date'].date()
 
 
 def load_data(files):
     st.session_state['errors'] = []
-    backup_list = []
-    obj_list = []
-    execution_list = []
-    
-    for file in files:
-        workbook = load_workbook(file)
-        sheet_names = workbook.sheetnames
-
-        for sheet_name in sheet_names:
-            sheet = workbook[sheet_name]
-            max_row = sheet.max_row
-            cell_value = sheet.cell(row=max_row, column=1).value
-            if cell_value and isinstance(cell_value, str) and "Veeam Backup & Replication" in cell_value:
-                backup, obj, errors = report_summary(sheet)
-                backup_list.append(backup)
-                obj_list.append(obj)
-                execution_list.append(get_backup_execution(sheet))
-
-                if errors:
-                    for error in errors:
-                        st.session_state['errors'].append(f"Error in file '{file.name}', sheet '{sheet_name}': {str(error)}")
-
-    if backup_list:
-        backup_df = combine(backup_list)
-        obj_df = combine(obj_list)
-        execution_df = merge_retry_rows(combine_exec(execution_list))
-
-        job_obj = get_job_objects(backup_df, obj_df)
-
-        st.session_state['uploaded_backup'] = backup_df
-        st.session_state['uploaded_obj'] = obj_df
-        st.session_state['uploaded_execution'] = execution_df
-
-        st.session_state['job_obj'] = job_obj
-
-        st.session_state['min_date'] = backup_df.loc[0, 'Date']
-        st.session_state['max_date'] = backup_df.iloc[-1]['Date']
-        st.session_state['year'] = pd.to_datetime(backup_df.loc[0, 'Date']).year
+    named_data = [(file.name, file.getvalue()) for file in files]
+    store, sheets = ingest_reports(named_data)
+
+    for file_name, sheet_name, (backup, obj, execution, errors) in sheets:
+        for error in errors:
+            st.session_state['errors'].append(f"Error in file '{file_name}', sheet '{sheet_name}': {error}")
+
+    ingested = store is not None and any(cache_key(data) in store['files'] for _, data in named_data)
+
+    if sheets or ingested:
+        use_store(store)
         st.session_state['report_not_found'] = False
+
+        if sheets and 'selected_date_range' in st.session_state:
+            st.session_state['params_reset'] = True
     else:
         st.session_state['report_not_found'] = True
 
@@ -57,6 +46,7 @@ st.header("File upload")
 
 if 'file_reset' in st.session_state and st.session_state['file_reset']:
     st.session_state.clear()
+    clear_warehouse()
     st.info("Data has been reset. You can now upload a new file.", icon=":material/info:")
 
 if 'file_uploader_key' not in st.session_state:
@@ -68,7 +58,17 @@ if 'report_not_found' in st.session_state and st.session_state['report_not_found
 
     st.session_state['file_uploader_key'] += 1
 
-if 'uploaded_backup' in st.session_state:
+if 'report_store' in st.session_state and store_changed(st.session_state['report_store']):
+    del st.session_state['report_store']
+
+if 'report_store' not in st.session_state:
+    store = open_store()
+
+    if store is not None:
+        use_store(store)
+        st.session_state['file_just_loaded'] = False
+
+if 'report_store' in st.session_state:
     if 'file_just_loaded' in st.session_state and st.session_state['file_just_loaded']:
         st.success("File successfully uploaded! Proceed to adjust the parameters.", icon=":material/task_alt:")
 
@@ -83,12 +83,25 @@ if 'uploaded_backup' in st.session_state:
 
     st.session_state['file_just_loaded'] = False
 
-    backup_df = st.session_state['uploaded_backup']
-    obj_df = st.session_state['uploaded_obj']
+    store = st.session_state['report_store']
+    preview_start = store['max_date'].replace(day=1)
+    backup_df, obj_df = load_backups(start=preview_start)
+
+    st.caption(f"{store['rows']['backup']:,} backup rows and {store['rows']['obj']:,} object rows "
+               f"from {store['min_date']:%d.%m.%Y} to {store['max_date']:%d.%m.%Y}. Showing the latest month from {preview_start:%d.%m.%Y}.")
 
     tab1, tab2 = st.tabs(['Backup data', 'Detailed backup data by object'])
-    tab1.dataframe(backup_df.astype(str))
-    tab2.dataframe(obj_df.astype(str))
+    tab1.dataframe(format_times(backup_df).astype(str))
+    tab2.dataframe(format_times(obj_df).astype(str))
+
+    new_files = st.file_uploader("Add new daily reports", type=["xlsx"], accept_multiple_files=True, key=f"append_uploader_{st.session_state['file_uploader_key']}")
+
+    if new_files:
+        with st.spinner("Uploading..."):
+            load_data(new_files)
+        st.session_state['file_uploader_key'] += 1
+        st.session_state['file_just_loaded'] = not st.session_state['report_not_found']
+        st.rerun()
 
     if st.button('Reset data', use_container_width=True):
         st.session_state['file_reset'] = True
@@ -102,5 +115,5 @@ else:
     if files:
         with st.spinner("Uploading..."):
             load_data(files)
-        st.session_state['file_just_loaded'] = True
+        st.session_state['file_just_loaded'] = not st.session_state['report_not_found']
         st.rerun()
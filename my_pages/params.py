@@ -1,12 +1,24 @@
 import streamlit as st
+import pandas as pd
 from utils.params_tools import *
+from utils.backup_loader import filter_job_objects, filter_backups, backup_counts, has_backups
+from utils.report_store import load_backups, store_changed
+from utils.report_cache import fingerprint
 from datetime import timedelta, date
 import calendar
 
 
+@st.cache_resource(max_entries=1)
+def backup_counts_cached(dataset, _store):
+    return backup_counts(_store['backup_days'], _store['obj_days'])
+
+
 st.header("Parameters")
 
-if 'uploaded_backup' not in st.session_state:
+if 'report_store' in st.session_state and store_changed(st.session_state['report_store']):
+    del st.session_state['report_store']
+
+if 'report_store' not in st.session_state:
     st.warning("Data file not uploaded yet. Please upload a data file to adjust the parameters.", icon=":material/warning:")
     if st.button(":material/arrow_back_ios: Back: Upload file", use_container_width=True):
         st.switch_page('my_pages/file_upload.py')
@@ -47,8 +59,8 @@ else:
             st.switch_page("my_pages/dashboard.py")
     else:
         execution_df = st.session_state['uploaded_execution']
+        execution_log = st.session_state['report_store']['execution_log']
 
-        year = st.session_state['year']
         min_date = st.session_state['min_date']
         max_date = st.session_state['max_date']
 
@@ -65,40 +77,39 @@ else:
                 )
             
         elif option == "Month and week":
-            month_week = get_month_week(execution_df)
+            month_week = get_month_week(execution_log)
 
             c1, c2 = st.columns(2)
 
             selected_month = c1.selectbox(
                 "Select month", 
                 month_week.keys(), 
-                format_func=lambda x: calendar.month_name[x])
+                format_func=lambda x: f"{calendar.month_name[x[1]]} {x[0]}")
 
             selected_week = c2.selectbox(
                 "Select week", 
                 month_week[selected_month], 
-                format_func=lambda x: f"Week {x}: {get_week_dates(year, selected_month, x)[0].strftime('%d.%m')} - {get_week_dates(year, selected_month, x)[1].strftime('%d.%m')}"
+                format_func=lambda x: f"Week {x}: {get_week_dates(*selected_month, x)[0].strftime('%d.%m')} - {get_week_dates(*selected_month, x)[1].strftime('%d.%m')}"
                 )
                 
-            selected_date_range = get_week_dates(year, selected_month, selected_week)
+            selected_date_range = get_week_dates(*selected_month, selected_week)
 
         elif option == "Day range in month":
-            months = get_month_week(execution_df).keys()
+            months = get_month_week(execution_log).keys()
 
             c1, c2, c3 = st.columns(3)
 
-            selected_month = c1.selectbox("Select month", months, format_func=lambda x: calendar.month_name[x])
+            selected_month = c1.selectbox("Select month", months, format_func=lambda x: f"{calendar.month_name[x[1]]} {x[0]}")
 
-            min_day, max_day = get_days_for_month(year, selected_month, min_date, max_date)
+            min_day, max_day = get_days_for_month(*selected_month, min_date, max_date)
 
             start_day = c2.number_input("Start day", min_day, max_day, min_day)
             end_day = c3.number_input("End day", start_day, max_day, max_day)
 
-            selected_date_range = (date(year, selected_month, start_day), date(year, selected_month, end_day))
+            selected_date_range = (date(*selected_month, start_day), date(*selected_month, end_day))
         
         elif option == "Predefined date ranges":
-            year = st.session_state['year']
-            month_week = get_month_week(execution_df)
+            month_week = get_month_week(execution_log)
             month_week_tuples = [(key, element) for key, values in month_week.items() for element in values]
 
             c1, c2 = st.columns([3, 1], vertical_alignment="bottom")
@@ -107,33 +118,33 @@ else:
 
             if predefined_option == "Last week":
                 last_week = month_week_tuples[-1]
-                selected_date_range = get_week_dates(year, last_week[0], last_week[1])
+                selected_date_range = get_week_dates(*last_week[0], last_week[1])
                 
             elif predefined_option == "Last 2 weeks":
                 last_2_weeks = month_week_tuples[-2:]
-                end_date = get_week_dates(year, last_2_weeks[1][0], last_2_weeks[1][1])
+                end_date = get_week_dates(*last_2_weeks[1][0], last_2_weeks[1][1])
                 start_date = end_date[0] - timedelta(days=7)
                 end_date = end_date[1]
                 selected_date_range = (start_date, end_date)
 
             elif predefined_option == "Last 3 weeks":
                 last_3_weeks = month_week_tuples[-3:]
-                end_date = get_week_dates(year, last_3_weeks[2][0], last_3_weeks[2][1])
+                end_date = get_week_dates(*last_3_weeks[2][0], last_3_weeks[2][1])
                 start_date = end_date[0] - timedelta(days=14)
                 end_date = end_date[1]
                 selected_date_range = (start_date, end_date)
             
             elif predefined_option == "Last 4 weeks":
                 last_4_weeks = month_week_tuples[-4:]
-                end_date = get_week_dates(year, last_4_weeks[3][0], last_4_weeks[3][1])
+                end_date = get_week_dates(*last_4_weeks[3][0], last_4_weeks[3][1])
                 start_date = end_date[0] - timedelta(days=21)
                 end_date = end_date[1]
                 selected_date_range = (start_date, end_date)
             
             elif predefined_option == "Last month":
                 last_month = list(month_week.items())[-1]
-                start_date = get_week_dates(year, last_month[0], last_month[1][0])[0]
-                end_date = get_week_dates(year, last_month[0], last_month[1][-1])[1]
+                start_date = get_week_dates(*last_month[0], last_month[1][0])[0]
+                end_date = get_week_dates(*last_month[0], last_month[1][-1])[1]
                 selected_date_range = (start_date, end_date)
 
             c2.write(f"{selected_date_range[0].strftime("%d.%m")} - {selected_date_range[1].strftime("%d.%m")}")
@@ -142,12 +153,9 @@ else:
         st.markdown("#### Backup job and virtual machines selection")
         job_obj = st.session_state['job_obj']
 
-        selected_job_obj = {}
-
-        container = st.container()
         all = st.checkbox("Select all", value=True)
 
-        with container:
+        with st.form("job_obj_selection", border=False):
             with st.expander("Select backup jobs"):
                 if all:
                     selected_jobs = st.multiselect("Select backup jobs", options=job_obj.keys(), default=job_obj.keys())
@@ -155,37 +163,36 @@ else:
                     selected_jobs = st.multiselect("Select backup jobs", options=job_obj.keys())
 
             with st.expander("Select virtual machines"):
-                if all:
-                    for job in selected_jobs:
-                        selected_job_obj[job] = st.multiselect(f"Select machines from {job}", options=job_obj[job], default=job_obj[job])
-                else:
-                    if not selected_jobs:
-                        st.write("No backup job selected")
-                    else:
-                        for job in selected_jobs:
-                            selected_job_obj[job] = st.multiselect(f"Select machines from {job}", options=job_obj[job], default=job_obj[job])
-
-        backup_df = st.session_state['uploaded_backup']
-        obj_df = st.session_state['uploaded_obj']
-
-        start_date = selected_date_range[0]
-        end_date = selected_date_range[1]
-        backup_df = backup_df[(backup_df['Date'] >= start_date) & (backup_df['Date'] <= end_date)]
-        obj_df = obj_df[(obj_df['Date'] >= start_date) & (obj_df['Date'] <= end_date)]
-
-        obj_df = obj_df[obj_df.apply(lambda row: row['Object'] in selected_job_obj.get(row['Backup Job'], []), axis=1)]
-        unique_pairs = obj_df[['Date', 'Backup Job']].drop_duplicates()
-        backup_df = backup_df[backup_df.set_index(['Date', 'Backup Job']).index.isin(unique_pairs.set_index(['Date', 'Backup Job']).index)]
-        
-        if backup_df.empty or obj_df.empty:
-            btn = st.button(f'Save', use_container_width=True, help=":material/warning: No data available for the selected parameters. Please change the date range or select different backup jobs.", disabled=True)
-        else:
-            if st.button(f'Save', use_container_width=True):
-                st.session_state['backup'] = backup_df
-                st.session_state['obj'] = obj_df
-                st.session_state['execution'] = execution_df[execution_df['Backup Job'].isin(selected_job_obj.keys())]
-
-                st.session_state['selected_date_range'] = selected_date_range
-                st.session_state['selected_job_obj'] = selected_job_obj
-                st.session_state['params_just_saved'] = True
-                st.rerun()
+                selected_machines = {job: st.multiselect(f"Select machines from {job}", options=job_obj[job], default=job_obj[job]) for job in job_obj}
+
+            submitted = st.form_submit_button(f'Save', use_container_width=True)
+
+        if submitted:
+            if len(selected_date_range) != 2:
+                st.warning("Select both the start and the end of the date range.", icon=":material/warning:")
+                st.stop()
+
+            start_date = pd.Timestamp(selected_date_range[0])
+            end_date = pd.Timestamp(selected_date_range[1])
+            selected_job_obj = {job: selected_machines[job] for job in selected_jobs}
+            store = st.session_state['report_store']
+            dataset = store['fingerprint']
+
+            if not has_backups(backup_counts_cached(dataset, store), start_date, end_date, selected_job_obj):
+                st.warning("No data available for the selected parameters. Please change the date range or select different backup jobs.", icon=":material/warning:")
+                st.stop()
+
+            backup_df, obj_df = load_backups(start_date, end_date, list(selected_job_obj))
+
+            obj_df = filter_job_objects(obj_df, selected_job_obj)
+            backup_df = filter_backups(backup_df, obj_df)
+
+            st.session_state['backup'] = backup_df
+            st.session_state['obj'] = obj_df
+            st.session_state['execution'] = execution_df[execution_df['Backup Job'].isin(selected_job_obj.keys())]
+
+            st.session_state['selected_date_range'] = selected_date_range
+            st.session_state['selected_job_obj'] = selected_job_obj
+            st.session_state['fingerprint'] = fingerprint(dataset, start_date, end_date, sorted((job, sorted(objs)) for job, objs in selected_job_obj.items()))
+            st.session_state['params_just_saved'] = True
+            st.rerun()
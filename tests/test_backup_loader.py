@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+from bench.synthetic import backup_frames
+from utils.backup_loader import get_last_backups
+
+
+# The row-by-row implementation that get_last_backups replaced, kept as the
+# reference for the equivalence tests and bench/bench_last_backups.py.
+def legacy_get_last_backups(backups, backups_obj):
+    backups_obj = backups_obj.iloc[::-1].reset_index(drop=True)
+
+    backup_job_obj = {}
+    last_backup_obj = backups_obj.iloc[0:0]
+
+    for i in range(len(backups_obj)):
+        current_job = backups_obj.loc[i, 'Backup Job']
+        current_obj = backups_obj.loc[i, 'Object']
+
+        if current_job not in backup_job_obj:
+            backup_job_obj[current_job] = []
+
+        if current_obj not in backup_job_obj[current_job]:
+            backup_job_obj[current_job].append(current_obj)
+            last_backup_obj = pd.concat([last_backup_obj, backups_obj.iloc[[i]]], ignore_index=True)
+
+    last_backup_obj.sort_values(['Date', 'Backup Job'], inplace=True)
+    last_backup_obj.reset_index(drop=True, inplace=True)
+
+    last_backup = pd.DataFrame(columns=backups.columns)
+
+    for i in range(len(last_backup_obj)):
+        backup_job = last_backup_obj.loc[i, 'Backup Job']
+        backup_date = last_backup_obj.loc[i, 'Date']
+
+        matching_backups = backups[(backups['Backup Job'] == backup_job) & (backups['Date'] == backup_date)]
+        if not matching_backups.empty:
+            matching_backups = matching_backups.sort_values(by='Start Time', ascending=False)
+            latest_backup = matching_backups.iloc[0:1]
+            last_backup = pd.concat([last_backup, latest_backup], ignore_index=True)
+
+        last_backup.drop_duplicates(inplace=True)
+
+    return last_backup, last_backup_obj
+
+
+@pytest.mark.parametrize('days, jobs, objects, seed', [(1, 1, 1, 0), (3, 2, 3, 1), (10, 5, 4, 2), (20, 8, 6, 3)])
+def test_get_last_backups_matches_loop(days, jobs, objects, seed):
+    backup, obj = backup_frames(days, jobs, objects, seed=seed)
+    backup, obj = backup.iloc[::3], obj.iloc[seed::2]
+
+    last_backup, last_obj = get_last_backups(backup, obj)
+    expected_backup, expected_obj = legacy_get_last_backups(backup, obj)
+
+    pd.testing.assert_frame_equal(last_obj, expected_obj)
+    pd.testing.assert_frame_equal(last_backup, expected_backup.reset_index(drop=True), check_dtype=False, check_categorical=False)
+
+
+def test_get_last_backups_keeps_latest_same_day_retry():
+    backup, obj = backup_frames(days=2, jobs=3, objects=3, max_retries=3, seed=4)
+
+    last_backup, _ = get_last_backups(backup, obj)
+    latest = backup.sort_values('Start Time').groupby(['Backup Job', 'Date'], observed=True).tail(1)
+
+    assert len(last_backup) == 3
+    assert set(zip(last_backup['Backup Job'], last_backup['Start Time'])) <= set(zip(latest['Backup Job'], latest['Start Time']))
+
+
+def test_get_last_backups_empty():
+    backup, obj = backup_frames(days=1, jobs=1, objects=1)
+
+    last_backup, last_obj = get_last_backups(backup.iloc[0:0], obj.iloc[0:0])
+
+    assert last_backup.empty and last_obj.empty
+    assert list(last_backup.columns) == list(backup.columns)
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from utils.data_processing import convert_to_gb, apply_to_df, useful_cols
+
+
+@pytest.mark.parametrize('size, gb', [
+    ('0 B', 0),
+    ('1 TB', 1024),
+    ('2 GB', 2),
+    ('512 MB', 0.5),
+    ('1048576 KB', 1),
+    ('1073741824 B', 1),
+    ('1,5 GB', 1.5),
+    ('2.25 TB', 2304),
+    (' 3 GB ', 3)
+])
+def test_convert_to_gb(size, gb):
+    assert convert_to_gb(np.array([size], dtype=object))[0] == pytest.approx(gb)
+
+
+@pytest.mark.parametrize('size', ['5 XB', 'GB', '1,5', 'n/a', None])
+def test_convert_to_gb_unknown_is_nan(size):
+    assert np.isnan(convert_to_gb(np.array([size], dtype=object))[0])
+
+
+def test_apply_to_df_converts_each_column():
+    backup = pd.DataFrame({'Total Size': ['1 TB', '0 B'], 'Data Read': ['512 MB', '1 TB']})
+    obj = pd.DataFrame({'Size': ['1,5 GB']})
+
+    apply_to_df([(backup, ['Total Size', 'Data Read']), (obj, ['Size'])])
+
+    assert list(backup.columns) == ['Total Size (GB)', 'Data Read (GB)']
+    assert backup['Total Size (GB)'].tolist() == [1024, 0]
+    assert backup['Data Read (GB)'].tolist() == [0.5, 1024]
+    assert obj['Size (GB)'].tolist() == [1.5]
+
+
+def test_end_datetime_rolls_over_midnight():
+    df = pd.DataFrame({
+        'Date': pd.to_datetime(['2024-05-01'] * 3),
+        'Start Time': pd.to_timedelta(['10:00:00', '23:30:00', '22:00:00']),
+        'End Time': pd.to_timedelta(['11:00:00', '00:15:00', '23:00:00']),
+        'Duration': pd.to_timedelta(['01:00:00', '00:45:00', '1 days 01:00:00']),
+        'Data Read (GB)': [60.0, 45.0, 1500.0]
+    })
+
+    useful_cols(df)
+
+    assert df['End Datetime'].tolist() == [pd.Timestamp('2024-05-01 11:00'), pd.Timestamp('2024-05-02 00:15'), pd.Timestamp('2024-05-02 23:00')]
+    assert df['Hour'].tolist() == [10, 23, 22]
+    assert df['Backup Speed (GB/min)'].tolist() == [1, 1, 1]
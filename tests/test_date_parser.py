@@ -0,0 +1,22 @@
+from datetime import datetime
+import pytest
+from utils.date_parser import parse_header_date
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('środa, 1 maja 2024 12:00:00', datetime(2024, 5, 1, 12, 0, 0)),
+    ('Wednesday, 1 May 2024 07:08:09', datetime(2024, 5, 1, 7, 8, 9)),
+    ('Wednesday, May 1, 2024 12:00:00 PM', datetime(2024, 5, 1, 12, 0, 0)),
+    ('2024-05-01 12:00:00', datetime(2024, 5, 1, 12, 0, 0)),
+    ('Job, 2024-05-01 12:00:00', datetime(2024, 5, 1, 12, 0, 0)),
+    ('2024/05/01 01:02:03', datetime(2024, 5, 1, 1, 2, 3)),
+    ('01.05.2024 12:00:00', datetime(2024, 5, 1, 12, 0, 0)),
+    ('01/05/2024 12:00:00', datetime(2024, 5, 1, 12, 0, 0)),
+])
+def test_parse_header_date(header, expected):
+    assert parse_header_date(header) == expected
+
+
+def test_invalid_header_raises_value_error():
+    with pytest.raises(ValueError):
+        parse_header_date('środa, 31 lutego 2024 12:00:00')
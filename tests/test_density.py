@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from scipy.stats import gaussian_kde
+from utils.density import histogram_density
+
+
+def test_empty_input():
+    result = histogram_density([np.nan, np.inf])
+
+    assert len(result['edges']) == len(result['counts']) == len(result['x']) == len(result['density']) == 0
+
+
+def test_constant_input():
+    result = histogram_density([4.0] * 10)
+
+    assert result['edges'].tolist() == [3.5, 4.5]
+    assert result['counts'].tolist() == [10]
+    assert len(result['density']) == 0
+
+
+def test_counts_match_numpy_histogram():
+    values = np.random.default_rng(0).gamma(2.0, 3.0, 5000)
+    result = histogram_density(values, bins=30)
+    counts, edges = np.histogram(values, bins=30)
+
+    np.testing.assert_allclose(result['edges'], edges)
+    assert abs(result['counts'] - counts).sum() <= 2 and result['counts'].sum() == len(values)
+
+
+def area(result, values):
+    bin_width = result['edges'][1] - result['edges'][0]
+    step = result['x'][1] - result['x'][0]
+
+    return result['density'].sum() * step / (bin_width * len(values))
+
+
+@pytest.mark.parametrize('values', [
+    np.random.default_rng(1).normal(50, 10, 20000),
+    np.concatenate([np.random.default_rng(2).normal(20, 3, 10000), np.random.default_rng(3).normal(60, 8, 10000)])
+])
+def test_density_integrates_to_one(values):
+    result = histogram_density(values)
+    bin_width = result['edges'][1] - result['edges'][0]
+
+    assert area(result, values) == pytest.approx(1, abs=0.02)
+    np.testing.assert_allclose(result['density'] / (bin_width * len(values)), gaussian_kde(values)(result['x']), rtol=0.05, atol=1e-4)
+
+
+def test_density_matches_kde_mass_near_an_edge():
+    values = np.random.default_rng(4).uniform(0, 1, 20000) ** 2 * 100
+    result = histogram_density(values)
+
+    assert area(result, values) == pytest.approx(gaussian_kde(values).integrate_box_1d(values.min(), values.max()), abs=0.01)
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+from utils.downsampling import downsample, time_buckets, MAX_POINTS
+
+
+def points(rows, series, seed=0):
+    rng = np.random.default_rng(seed)
+
+    return pd.DataFrame({
+        'Start Datetime': pd.Timestamp('2024-05-01') + pd.to_timedelta(np.sort(rng.integers(0, 30 * 86400, rows)), unit='s'),
+        'Size (GB)': rng.gamma(2.0, 10.0, rows),
+        'Object': rng.choice([f'VM-{i}' for i in range(series)], rows)
+    })
+
+
+def test_small_frames_pass_through():
+    df = points(MAX_POINTS, 3)
+    df.loc[0, 'Size (GB)'] = np.nan
+
+    assert downsample(df, 'Start Datetime', 'Size (GB)', 'Object') is df
+
+
+def test_buckets_keep_their_extremes():
+    df = points(20000, 4)
+    df.loc[5, 'Size (GB)'] = np.nan
+    sampled = downsample(df, 'Start Datetime', 'Size (GB)', 'Object', width=50, max_points=1000)
+
+    assert len(sampled) <= 2 * 50 * 4
+    assert sampled['Size (GB)'].notna().all()
+    assert sampled.index.is_monotonic_increasing
+
+    df = df.dropna()
+    buckets = time_buckets(df['Start Datetime'].to_numpy(), 50)
+    expected = df.groupby([df['Object'], buckets])['Size (GB)'].agg(['min', 'max'])
+    kept = sampled.groupby([sampled['Object'], buckets[df.index.get_indexer(sampled.index)]])['Size (GB)'].agg(['min', 'max'])
+
+    pd.testing.assert_frame_equal(kept, expected)
+    assert df.groupby('Object')['Size (GB)'].max().equals(sampled.groupby('Object')['Size (GB)'].max())
+    assert df.groupby('Object')['Size (GB)'].min().equals(sampled.groupby('Object')['Size (GB)'].min())
@@ -0,0 +1,88 @@
+import random
+import pandas as pd
+import pytest
+from utils.execution_loader import merge_retry_rows
+
+
+COLUMNS = ['Month', 'Week Number', 'Day of Week', 'Backup Job', 'Backup', 'Backup (Retry 1)', 'Backup (Retry 2)', 'Status']
+
+
+# The row-by-row implementation that merge_retry_rows replaced, kept as the
+# reference for the equivalence tests.
+def legacy_merge_retry_rows(df):
+    backup_columns = df.columns[4:]
+    rows_to_remove = []
+
+    for i, row in df.iterrows():
+        backup_job = row['Backup Job']
+
+        for col1 in backup_columns:
+            if pd.notna(row[col1]):
+                break
+            else:
+                for col2 in backup_columns:
+                    if pd.notna(row[col2]):
+                        for j in range(i - 1, -1, -1):
+                            if df.loc[j, 'Backup Job'] == backup_job and pd.isna(df.loc[j, col2]):
+                                df.loc[j, col2] = row[col2]
+                                df.loc[j, 'Status'] = row['Status']
+                                rows_to_remove.append(i)
+                                break
+    df = df.drop(rows_to_remove).reset_index(drop=True)
+    return df
+
+
+def execution_frame(days, jobs, seed):
+    random.seed(seed)
+    rows = []
+
+    for day in range(1, days + 1):
+        retries = []
+
+        for job in range(jobs):
+            status = random.choices(['Success', 'Warning', 'Error'], [1, 1, 2])[0]
+            rows.append((5, day // 7 + 1, 'Monday', f'Job {job}', f'{job:02d}:00:00', None, None, status))
+
+            if status == 'Error':
+                for retry in range(1, random.randint(1, 2) + 1):
+                    times = [None, None]
+                    times[retry - 1] = f'{job:02d}:{retry * 10}:00'
+                    retries.append((5, day // 7 + 1, 'Monday', f'Job {job}', None, *times, random.choice(['Success', 'Error'])))
+
+        random.shuffle(retries)
+        retries.sort(key=lambda row: row[5] is None)
+        rows += retries
+
+    return pd.DataFrame(rows, columns=COLUMNS).astype({'Backup Job': 'category', 'Status': 'category'})
+
+
+@pytest.mark.parametrize('days, jobs, seed', [(1, 1, 0), (1, 4, 1), (5, 6, 2), (14, 10, 3)])
+def test_merge_retry_rows_matches_loop(days, jobs, seed):
+    df = execution_frame(days, jobs, seed)
+    assert df['Backup'].isna().any()
+
+    expected = legacy_merge_retry_rows(df.copy())
+    merged = merge_retry_rows(df)
+
+    pd.testing.assert_frame_equal(merged, expected, check_dtype=False, check_categorical=False)
+
+
+def test_merge_retry_rows_joins_retries_over_several_rows():
+    df = pd.DataFrame([
+        (5, 1, 'Monday', 'Job 0', '01:00:00', None, None, 'Error'),
+        (5, 1, 'Monday', 'Job 1', '02:00:00', None, None, 'Success'),
+        (5, 1, 'Monday', 'Job 0', None, '01:10:00', None, 'Error'),
+        (5, 1, 'Monday', 'Job 0', None, None, '01:20:00', 'Success')
+    ], columns=COLUMNS)
+
+    merged = merge_retry_rows(df)
+
+    assert merged['Backup Job'].tolist() == ['Job 0', 'Job 1']
+    assert merged.loc[0, ['Backup (Retry 1)', 'Backup (Retry 2)', 'Status']].tolist() == ['01:10:00', '01:20:00', 'Success']
+    pd.testing.assert_frame_equal(merged, legacy_merge_retry_rows(df.copy()))
+
+
+def test_merge_retry_rows_empty():
+    merged = merge_retry_rows(pd.DataFrame(columns=COLUMNS))
+
+    assert merged.empty and list(merged.columns) == COLUMNS
@@ -0,0 +1,29 @@
+import pandas as pd
+from datetime import date
+from utils.params_tools import get_month_week, get_week_dates, get_days_for_month
+
+
+def execution(days):
+    dates = pd.to_datetime(days)
+    first_days = dates.to_period('M').to_timestamp()
+
+    return pd.DataFrame({
+        'Month': dates.month,
+        'Week Number': (dates.day - 1 + first_days.weekday) // 7 + 1,
+        'Start Datetime': dates
+    })
+
+
+def test_month_week_spans_year_boundary():
+    month_week = get_month_week(execution(['2024-12-30', '2024-12-31', '2025-01-01', '2025-01-06', '2025-12-01']))
+
+    assert list(month_week) == [(2024, 12), (2025, 1), (2025, 12)]
+    assert month_week[(2024, 12)] == [6]
+    assert month_week[(2025, 1)] == [1, 2]
+    assert get_week_dates(2024, 12, 6) == (date(2024, 12, 30), date(2024, 12, 31))
+    assert get_week_dates(2025, 1, 1) == (date(2025, 1, 1), date(2025, 1, 5))
+
+
+def test_days_for_month_in_the_following_year():
+    assert get_days_for_month(2025, 1, date(2024, 12, 20), date(2025, 1, 14)) == (1, 14)
+    assert get_days_for_month(2024, 12, date(2024, 12, 20), date(2025, 1, 14)) == (20, 31)
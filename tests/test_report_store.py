@@ -0,0 +1,166 @@
+import os
+import pytest
+import threading
+import datetime as dt
+import pandas as pd
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+import utils.report_cache as report_cache
+import utils.report_warehouse as report_warehouse
+from bench.synthetic import make_report
+from utils.backup_loader import backup_counts, backup_days, has_backups
+from utils.report_cache import cache_key
+from utils.schema import TIME_TYPE
+from utils.report_store import ingest_reports, open_store, store_changed, load_backups
+
+
+@pytest.fixture
+def warehouse(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_warehouse, 'WAREHOUSE_DIR', str(tmp_path / 'warehouse'))
+    monkeypatch.setattr(report_cache, 'CACHE_DIR', str(tmp_path / 'cache'))
+
+    return tmp_path
+
+
+def report(tmp_path, name, **kwargs):
+    path = tmp_path / f'{name}.xlsx'
+    make_report(path, **kwargs)
+
+    return name, path.read_bytes()
+
+
+def test_cleared_warehouse_reads_as_empty(warehouse):
+    store, sheets = ingest_reports([report(warehouse, 'may', days=3, jobs=2, objects=2)], workers=1)
+    assert sheets and open_store() is not None
+
+    report_warehouse.clear_warehouse()
+    backup, obj = load_backups()
+
+    assert store_changed(store)
+    assert backup.empty and obj.empty
+    assert {'Date', 'Backup Job', 'Start Time'} <= set(backup.columns)
+    assert {'Date', 'Backup Job', 'Object'} <= set(obj.columns)
+    assert not len(backup_counts(backup, obj)['pairs'])
+
+
+def test_store_changed_after_another_upload(warehouse):
+    store, _ = ingest_reports([report(warehouse, 'may', days=3, jobs=2, objects=2)], workers=1)
+    assert not store_changed(store)
+
+    ingest_reports([report(warehouse, 'june', days=3, jobs=2, objects=2, start=dt.date(2024, 6, 1))], workers=1)
+
+    assert store_changed(store)
+    assert not store_changed(open_store())
+
+
+def test_concurrent_ingestion_keeps_both_reports(warehouse):
+    reports = [report(warehouse, f'day{day}', days=2, jobs=2, objects=2, start=dt.date(2024, 5, 1 + 2 * day), seed=day) for day in range(4)]
+    threads = [threading.Thread(target=ingest_reports, args=([named],), kwargs={'workers': 1}) for named in reports]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    store = open_store()
+    rows = pq.read_table(report_warehouse.warehouse_path('backup')).column(report_warehouse.SEQUENCE).to_pylist()
+
+    assert len(store['files']) == len(reports)
+    assert sorted(rows) == list(range(len(rows)))
+    assert len(load_backups()[0]) == len(rows)
+
+
+def test_clear_warehouse_keeps_lock_file(warehouse):
+    ingest_reports([report(warehouse, 'may', days=2, jobs=2, objects=2)], workers=1)
+    report_warehouse.clear_warehouse()
+
+    assert open_store() is None
+    assert os.listdir(report_warehouse.WAREHOUSE_DIR) == [report_warehouse.LOCK_FILE]
+
+
+def test_query_returns_sorted_categories(warehouse):
+    ingest_reports([report(warehouse, 'may', days=2, jobs=3, objects=3)], workers=1)
+    ingest_reports([report(warehouse, 'june', days=2, jobs=11, objects=11, start=dt.date(2024, 6, 1))], workers=1)
+    backup, obj = load_backups()
+
+    for df, column in [(backup, 'Backup Job'), (obj, 'Backup Job'), (obj, 'Object')]:
+        categories = list(df[column].cat.categories)
+        assert categories == sorted(categories)
+
+
+def day_set(df):
+    return set(df.astype(str).itertuples(index=False))
+
+
+def test_day_tables_match_stored_backups(warehouse):
+    ingest_reports([report(warehouse, 'june', days=3, jobs=3, objects=3, start=dt.date(2024, 6, 1))], workers=1)
+    ingest_reports([report(warehouse, 'may', days=3, jobs=4, objects=2, seed=1)], workers=1)
+    store = open_store()
+    backup, obj = load_backups()
+
+    for stored, expected in zip([store['backup_days'], store['obj_days']], backup_days(backup, obj)):
+        assert day_set(stored) == day_set(expected)
+
+    counts = backup_counts(store['backup_days'], store['obj_days'])
+    assert has_backups(counts, dt.datetime(2024, 5, 3), dt.datetime(2024, 5, 3), {'Job 3': ['VM-3-1']})
+    assert not has_backups(counts, dt.datetime(2024, 6, 1), dt.datetime(2024, 6, 3), {'Job 3': ['VM-3-1']})
+    assert not has_backups(counts, dt.datetime(2024, 5, 4), dt.datetime(2024, 5, 31), {'Job 0': ['VM-0-0']})
+
+
+def test_missing_day_tables_are_rebuilt(warehouse):
+    ingest_reports([report(warehouse, 'may', days=2, jobs=2, objects=2)], workers=1)
+    expected = open_store()['obj_days']
+
+    for name in ['backup_days', 'obj_days']:
+        os.remove(report_warehouse.warehouse_path(f'{name}.parquet'))
+
+    assert day_set(open_store()['obj_days']) == day_set(expected)
+
+
+def test_execution_keeps_the_exported_columns(warehouse):
+    store, _ = ingest_reports([report(warehouse, 'may', days=10, jobs=5, objects=2)], workers=1)
+    columns = list(store['execution'].columns)
+    retries = columns[5:-1]
+
+    assert columns[:5] == ['Month', 'Week Number', 'Day of Week', 'Backup Job', 'Backup']
+    assert columns[-1] == 'Status'
+    assert retries and retries == [f'Backup (Retry {retry})' for retry in range(1, len(retries) + 1)]
+    assert 'Start Datetime' in store['execution_log'].columns
+
+
+def test_file_without_report_is_not_recorded(warehouse):
+    workbook = Workbook()
+    workbook.active.append(('Not a Veeam report',))
+    workbook.save(warehouse / 'other.xlsx')
+    other = ('other', (warehouse / 'other.xlsx').read_bytes())
+
+    store, sheets = ingest_reports([report(warehouse, 'may', days=2, jobs=2, objects=2), other], workers=1)
+
+    assert [file_name for file_name, _, _ in sheets] == ['may']
+    assert cache_key(other[1]) not in store['files']
+    assert cache_key(other[1]) not in open_store()['files']
+
+    _, sheets = ingest_reports([other], workers=1)
+    assert sheets == []
+
+
+def test_times_are_stored_typed(warehouse):
+    ingest_reports([report(warehouse, 'may', days=2, jobs=2, objects=2)], workers=1)
+    backup, obj = load_backups()
+
+    for df in (backup, obj):
+        assert all(df[column].dtype == TIME_TYPE for column in ['Start Time', 'End Time', 'Duration'])
+        assert df['Start Time'].notna().all()
+
+
+def test_outdated_warehouse_is_replaced(warehouse):
+    ingest_reports([report(warehouse, 'may', days=2, jobs=2, objects=2)], workers=1)
+    meta = report_warehouse.read_meta()
+    report_warehouse.write_meta({**meta, 'version': meta['version'] - 1})
+
+    assert open_store() is None
+
+    store, _ = ingest_reports([report(warehouse, 'june', days=2, jobs=2, objects=2, start=dt.date(2024, 6, 1))], workers=1)
+
+    assert len(store['files']) == 1
+    assert load_backups()[0]['Date'].min() == pd.Timestamp(2024, 6, 1)
@@ -0,0 +1,23 @@
+import datetime as dt
+import pandas as pd
+from utils.schema import BACKUP_SCHEMA, TIME_TYPE, apply_schema, format_times
+
+
+def test_times_are_parsed_to_timedeltas():
+    df = apply_schema(pd.DataFrame({
+        'Start Time': ['22:00:05', dt.time(9, 5, 1), None, 'n/a'],
+        'Duration': ['0:45:12', '1:00:00', '0:00:00', None]
+    }), BACKUP_SCHEMA)
+
+    assert df['Start Time'].dtype == TIME_TYPE and df['Duration'].dtype == TIME_TYPE
+    assert df['Start Time'][:2].tolist() == [pd.Timedelta(hours=22, seconds=5), pd.Timedelta(hours=9, minutes=5, seconds=1)]
+    assert df['Start Time'][2:].isna().all()
+    assert df['Duration'].dt.total_seconds()[:3].tolist() == [2712, 3600, 0]
+
+
+def test_typed_times_pass_through_and_format_as_clock():
+    df = apply_schema(pd.DataFrame({'Start Time': ['22:00:05', None], 'Backup Job': ['a', 'b']}), BACKUP_SCHEMA)
+
+    assert apply_schema(df, BACKUP_SCHEMA)['Start Time'].equals(df['Start Time'])
+    assert format_times(df)['Start Time'].tolist() == ['22:00:05', pd.NA]
+    assert format_times(df)['Backup Job'].equals(df['Backup Job'])
@@ -1,191 +1,110 @@
+import numpy as np
 import pandas as pd
-import re
-from dateutil import parser
-import streamlit as st
-
-
-MONTHS_MAP = {
-    'stycznia': 'January', 'styczeń': 'January',
-    'lutego': 'February', 'luty': 'February',
-    'marca': 'March', 'marzec': 'March',
-    'kwietnia': 'April', 'kwiecień': 'April',
-    'maja': 'May', 'maj': 'May',
-    'czerwca': 'June', 'czerwiec': 'June',
-    'lipca': 'July', 'lipiec': 'July',
-    'sierpnia': 'August', 'sierpień': 'August',
-    'września': 'September', 'wrzesień': 'September',
-    'października': 'October', 'październik': 'October',
-    'listopada': 'November', 'listopad': 'November',
-    'grudnia': 'December', 'grudzień': 'December'
-}
-
-
-def replace_months(date_str):
-    for key, value in MONTHS_MAP.items():
-        date_str = date_str.replace(key, value)
-    return date_str
-
-
-def report_summary(sheet):
-    errors = []
-
-    backup_entry_template = {
-        'Date': None,
-        'Backup Job': None,
-        'Status': None,
-        'Success': None,
-        'Warning': None,
-        'Error': None,
-        'Start Time': None,
-        'End Time': None,
-        'Duration': None,
-        'Total Size': None,
-        'Backup Size': None,
-        'Data Read': None,
-        'Transferred': None,
-        'Dedupe': None,
-        'Compression': None
-    }
+from utils.schema import BACKUP_SCHEMA, OBJECT_SCHEMA, apply_schema, concat_frames
 
-    details_entry_template = {
-        'Date': None,
-        'Backup Job': None,
-        'Object': None,
-        'Status': None,
-        'Start Time': None,
-        'End Time': None,
-        'Duration': None,
-        'Size': None,
-        'Read': None,
-        'Transferred': None
-    }
 
-    backup_jobs_list = []
-    details_list = []
-    details_section = False
-
-    for row in sheet.iter_rows(values_only=True):
-        if row[0] and "Veeam Backup & Replication" in row[0]:
-            break
-        elif row[0] and "Backup job" in row[0]:
-            details_section = False
-            backup_entry = backup_entry_template.copy()
-            if "Retry" in row[0]:
-                match = re.search(r'Backup job: (.*?) \(Retry \d+\)', row[0])
-                if match:
-                    backup_entry['Backup Job'] = match.group(1)
-            else:
-                backup_entry['Backup Job'] = row[0].split("Backup job: ")[1].strip()
-            backup_entry['Status'] = row[8]
-        elif row[0] in ["Success", "Warning", "Error"] and not details_section:
-            backup_entry[row[0]] = row[1]
-            backup_entry.update({
-                'Start Time': row[3] if row[0] == "Success" else backup_entry['Start Time'],
-                'Total Size': row[5] if row[0] == "Success" else backup_entry['Total Size'],
-                'Backup Size': row[7] if row[0] == "Success" else backup_entry['Backup Size'],
-                'End Time': row[3] if row[0] == "Warning" else backup_entry['End Time'],
-                'Data Read': row[5] if row[0] == "Warning" else backup_entry['Data Read'],
-                'Dedupe': row[7] if row[0] == "Warning" else backup_entry['Dedupe'],
-                'Duration': row[3] if row[0] == "Error" else backup_entry['Duration'],
-                'Transferred': row[5] if row[0] == "Error" else backup_entry['Transferred'],
-                'Compression': row[7] if row[0] == "Error" else backup_entry['Compression'],
-            })
-        elif row[0] and re.search(r"\d{1,2}:\d{2}:\d{2}", row[0]):
-            date_str = replace_months(row[0].split(',')[-1].strip())
-            try:
-                parsed_date = parser.parse(date_str, yearfirst=True)
-                backup_entry['Date'] = parsed_date.date()
-                backup_jobs_list.append(backup_entry)
-            except ValueError as e:
-                errors.append(e)
-                continue
-        elif row[0] and row[0] == "Details":
-            details_section = True
-        elif row[0] and details_section and row[0] != 'Name':
-            details_entry = details_entry_template.copy()
-            details_entry.update({
-                'Date': backup_entry['Date'],
-                'Backup Job': backup_entry['Backup Job'],
-                'Object': row[0],
-                'Status': row[1],
-                'Start Time': row[2],
-                'End Time': row[3],
-                'Size': row[4],
-                'Read': row[5],
-                'Transferred': row[6],
-                'Duration': row[7]
-            })
-            details_list.append(details_entry)
-
-    backup_df, obj_df = pd.DataFrame(backup_jobs_list), pd.DataFrame(details_list)
+def report_summary(jobs, details):
+    backup_df, obj_df = pd.DataFrame(jobs), pd.DataFrame(details)
 
     backup_df, obj_df = backup_df.dropna().reset_index(drop=True), obj_df.dropna().reset_index(drop=True)
+    backup_df, obj_df = apply_schema(backup_df, BACKUP_SCHEMA), apply_schema(obj_df, OBJECT_SCHEMA)
 
-    return backup_df, obj_df, errors
+    return backup_df, obj_df
 
 
 def get_last_backups(backups, backups_obj):
-    backups_obj = backups_obj.iloc[::-1].reset_index(drop=True)
+    last_backup_obj = backups_obj.drop_duplicates(['Backup Job', 'Object'], keep='last').iloc[::-1]
+    last_backup_obj = last_backup_obj.sort_values(['Date', 'Backup Job'], kind='stable').reset_index(drop=True)
 
-    backup_job_obj = {}
-    last_backup_obj = backups_obj.iloc[0:0]
+    latest_backups = backups.sort_values('Start Time', ascending=False, kind='stable').drop_duplicates(['Backup Job', 'Date'])
+    last_backup_keys = last_backup_obj[['Backup Job', 'Date']].drop_duplicates()
 
-    for i in range(len(backups_obj)):
-        current_job = backups_obj.loc[i, 'Backup Job']
-        current_obj = backups_obj.loc[i, 'Object']
+    last_backup = last_backup_keys.merge(latest_backups, on=['Backup Job', 'Date'], how='inner')[backups.columns]
+    last_backup = last_backup.drop_duplicates().reset_index(drop=True)
 
-        if current_job not in backup_job_obj:
-            backup_job_obj[current_job] = []
+    return last_backup, last_backup_obj
 
-        if current_obj not in backup_job_obj[current_job]:
-            backup_job_obj[current_job].append(current_obj)
-            last_backup_obj = pd.concat([last_backup_obj, backups_obj.iloc[[i]]], ignore_index=True)
 
-    last_backup_obj.sort_values(['Date', 'Backup Job'], inplace=True)
-    last_backup_obj.reset_index(drop=True, inplace=True)
+def get_job_objects(backups_obj):
+    job_objects = backups_obj[['Backup Job', 'Object']].drop_duplicates()
 
-    last_backup = pd.DataFrame(columns=backups.columns)
+    return {job: objects.tolist() for job, objects in job_objects.groupby('Backup Job', sort=False, observed=True)['Object']}
 
-    for i in range(len(last_backup_obj)):
-        backup_job = last_backup_obj.loc[i, 'Backup Job']
-        backup_date = last_backup_obj.loc[i, 'Date']
 
-        matching_backups = backups[(backups['Backup Job'] == backup_job) & (backups['Date'] == backup_date)]
-        if not matching_backups.empty:
-            matching_backups = matching_backups.sort_values(by='Start Time', ascending=False)
-            latest_backup = matching_backups.iloc[0:1]
-            last_backup = pd.concat([last_backup, latest_backup], ignore_index=True)
+def category_codes(values, categories):
+    return np.append(categories.get_indexer(values.cat.categories), -1)[values.cat.codes]
 
-        last_backup.drop_duplicates(inplace=True)
 
-    return last_backup, last_backup_obj
+def filter_job_objects(df, job_obj):
+    jobs, objects = df['Backup Job'].cat.categories, df['Object'].cat.categories
+    selected = np.zeros((len(jobs) + 1, len(objects) + 1), dtype=bool)
+
+    pairs = [(job, obj) for job, objs in job_obj.items() for obj in objs]
+    if pairs:
+        job_codes, obj_codes = jobs.get_indexer([job for job, _ in pairs]), objects.get_indexer([obj for _, obj in pairs])
+        selected[job_codes, obj_codes] = True
+        selected[-1, :] = selected[:, -1] = False
+
+    mask = selected[df['Backup Job'].cat.codes, df['Object'].cat.codes]
+
+    return df if mask.all() else df[mask]
+
+
+def filter_backups(backups, backups_obj):
+    if backups_obj.empty:
+        return backups.iloc[0:0]
 
+    dates = backups_obj['Date'].to_numpy()
+    unique_dates = np.unique(dates)
+    jobs = backups_obj['Backup Job'].cat
 
-def get_job_objects(backups, backups_obj):
-    backup_jobs = []
-    backup_job_obj = {}
+    present = np.zeros((len(unique_dates) + 1, len(jobs.categories) + 1), dtype=bool)
+    present[np.searchsorted(unique_dates, dates), jobs.codes] = True
+    present[:, -1] = False
 
-    for i in range(len(backups)):
-        current_job = backups.loc[i, 'Backup Job']
+    backup_dates = backups['Date'].to_numpy()
+    date_codes = np.searchsorted(unique_dates, backup_dates)
+    date_codes[unique_dates.take(date_codes, mode='clip') != backup_dates] = len(unique_dates)
 
-        if current_job not in backup_jobs:
-            backup_jobs.append(current_job)
+    mask = present[date_codes, category_codes(backups['Backup Job'], jobs.categories)]
+
+    return backups if mask.all() else backups[mask]
+
+
+def backup_days(backups, backups_obj):
+    return backups[['Date', 'Backup Job']].drop_duplicates(ignore_index=True), backups_obj[['Date', 'Backup Job', 'Object']].drop_duplicates(ignore_index=True)
+
+
+def backup_counts(backups, backups_obj):
+    backups_obj = filter_backups(backups_obj, backups)
+    jobs, objects = backups_obj['Backup Job'].cat, backups_obj['Object'].cat
+
+    dates, date_codes = np.unique(backups_obj['Date'].to_numpy(), return_inverse=True)
+    pairs, pair_codes = np.unique(jobs.codes.astype(np.int64) * len(objects.categories) + objects.codes, return_inverse=True)
+
+    counts = np.bincount((date_codes + 1) * len(pairs) + pair_codes, minlength=(len(dates) + 1) * len(pairs))
+
+    return {
+        'dates': pd.DatetimeIndex(dates),
+        'pairs': pd.MultiIndex.from_arrays([jobs.categories[pairs // len(objects.categories)], objects.categories[pairs % len(objects.categories)]]),
+        'totals': counts.reshape(len(dates) + 1, len(pairs)).cumsum(axis=0)
+    }
 
-    for i in range(len(backups_obj)):
-        current_job = backups_obj.loc[i, 'Backup Job']
-        current_obj = backups_obj.loc[i, 'Object']
 
-        if current_job not in backup_job_obj:
-            backup_job_obj[current_job] = []
+def has_backups(counts, start, end, job_obj):
+    pairs = [(job, obj) for job, objs in job_obj.items() for obj in objs]
+    if not pairs or not len(counts['pairs']):
+        return False
 
-        if current_obj not in backup_job_obj[current_job]:
-            backup_job_obj[current_job].append(current_obj)
+    first, last = counts['dates'].searchsorted(start, side='left'), counts['dates'].searchsorted(end, side='right')
+    columns = counts['pairs'].get_indexer(pairs)
+    columns = columns[columns >= 0]
 
-    return backup_job_obj
+    return bool((counts['totals'][last, columns] > counts['totals'][first, columns]).any())
 
 
 def combine(dfs):
-    df_combined = pd.concat(dfs)
+    df_combined = concat_frames(dfs)
     df_combined.drop_duplicates(inplace=True)
     df_combined.sort_values(['Date', 'Start Time'], inplace=True)
     df_combined.reset_index(drop=True, inplace=True)
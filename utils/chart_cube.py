@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+
+ROWS = 'Rows'
+COUNT_SUFFIX = ' Count'
+
+BACKUP_KEYS = ['Backup Job', 'Status', 'Date', 'Hour', 'Day of Week']
+OBJECT_KEYS = ['Backup Job', 'Object', 'Status']
+
+BACKUP_MEASURES = ['Success', 'Warning', 'Error', 'Total Size (GB)', 'Backup Size (GB)', 'Data Read (GB)', 'Duration (minutes)', 'Backup Speed (GB/min)', 'Dedupe', 'Compression']
+OBJECT_MEASURES = ['Success', 'Warning', 'Error', 'Size (GB)', 'Read (GB)', 'Transferred (GB)', 'Duration (minutes)', 'Backup Speed (GB/min)']
+
+
+def build_cube(df, keys, measures):
+    values = df[measures]
+    counts = values.notna().astype(np.int64).add_suffix(COUNT_SUFFIX)
+
+    columns = pd.concat([df[keys], values, counts], axis=1).assign(**{ROWS: 1})
+
+    return columns.groupby(keys, observed=True, dropna=False, sort=False).sum().reset_index()
+
+
+def build_cubes(backup, obj):
+    return {
+        'backup_cube': build_cube(backup, BACKUP_KEYS, BACKUP_MEASURES),
+        'obj_cube': build_cube(obj, OBJECT_KEYS, OBJECT_MEASURES)
+    }
+
+
+def cube_sum(cube, by, measures):
+    return cube.groupby(by, observed=True)[measures].sum()
+
+
+def cube_mean(cube, by, measures):
+    sums = cube_sum(cube, by, measures + [f'{measure}{COUNT_SUFFIX}' for measure in measures])
+
+    return sums[measures] / sums.drop(measures, axis=1).to_numpy()
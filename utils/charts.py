@@ -3,13 +3,27 @@ import numpy as np
 import plotly.express as px
 import seaborn as sns
 import plotly.graph_objects as go
-from scipy.stats import gaussian_kde
 from plotly.subplots import make_subplots
 import warnings
+from utils.chart_cube import cube_sum, cube_mean, ROWS
+from utils.data_processing import STATUSES
+from utils.density import histogram_density
+from utils.downsampling import downsample, render_mode
+from utils.schema import DAY_OF_WEEK
 
 
-def status(df):
-    status_counts = df['Status'].value_counts(normalize=True) * 100
+PERFORMANCE_SIZES = ['Backup Size (GB)', 'Data Read (GB)', 'Transferred (GB)']
+PERFORMANCE_RATIOS = ['Dedupe', 'Compression']
+PERFORMANCE_TITLES = ['Backup Size, Data Read, Transferred', 'Dedupe and Compression']
+
+MAX_FACET_TRACES = 60
+FACET_COLUMNS = 3
+FACET_HEIGHT = 300
+
+
+def status(cube):
+    status_counts = cube_sum(cube, 'Status', ROWS).sort_values(ascending=False, kind='stable')
+    status_counts = status_counts / status_counts.sum() * 100
 
     fig = px.pie(values=status_counts, names=status_counts.index, 
                 title='Backup Job Status Distribution', 
@@ -20,15 +34,9 @@ def status(df):
     return fig
 
 
-def status_by_backup(df):
-    status = df[['Backup Job', 'Status']]
-    status = status.copy()
-
-    status['Success'] = status['Status'].apply(lambda x: 1 if x == 'Success' else 0)
-    status.loc[:, 'Warning'] = status['Status'].apply(lambda x: 1 if x == 'Warning' else 0)
-    status.loc[:, 'Error'] = status['Status'].apply(lambda x: 1 if x == 'Error' else 0)
-
-    summary = status.groupby('Backup Job')[['Success', 'Warning', 'Error']].sum().reset_index()
+def status_by_backup(cube):
+    summary = cube_sum(cube, ['Backup Job', 'Status'], ROWS).unstack('Status', fill_value=0)
+    summary = summary.reindex(columns=STATUSES, fill_value=0).rename_axis(columns=None).reset_index()
     summary_long = summary.melt(id_vars='Backup Job', value_vars=['Success', 'Warning', 'Error'], 
                                 var_name='Status', value_name='Count')
 
@@ -49,8 +57,8 @@ def status_by_backup(df):
     return fig
 
 
-def error(df):
-    backup_stats = df.groupby('Backup Job')[['Success', 'Error', 'Warning']].sum().reset_index()
+def error(cube):
+    backup_stats = cube_sum(cube, 'Backup Job', ['Success', 'Error', 'Warning']).reset_index()
     backup_stats['Total'] = backup_stats['Error'] + backup_stats['Success'] + backup_stats['Warning']
     backup_stats['Error Rate'] = backup_stats['Error'] / backup_stats['Total']
 
@@ -75,8 +83,8 @@ def error(df):
     return fig
 
 
-def error_daily(df):
-    daily_stats = df.groupby('Date')[['Success', 'Error', 'Warning']].sum().reset_index()
+def error_daily(cube):
+    daily_stats = cube_sum(cube, 'Date', ['Success', 'Error', 'Warning']).reset_index()
     daily_stats['Total'] = daily_stats['Error'] + daily_stats['Success'] + daily_stats['Warning']
     daily_stats['Error Rate'] = daily_stats['Error'] / daily_stats['Total']
 
@@ -94,8 +102,8 @@ def error_daily(df):
     return fig
 
 
-def error_hour(df):
-    hourly_stats = df.groupby('Hour')[['Success', 'Error', 'Warning']].sum().reset_index()
+def error_hour(cube):
+    hourly_stats = cube_sum(cube, 'Hour', ['Success', 'Error', 'Warning']).reset_index()
     hourly_stats['Total'] = hourly_stats['Error'] + hourly_stats['Success'] + hourly_stats['Warning']
     hourly_stats['Error Rate'] = hourly_stats['Error'] / hourly_stats['Total']
 
@@ -113,8 +121,8 @@ def error_hour(df):
     return fig
 
 
-def plot_avg(df, x_col, title, x_label):
-    performance = df.groupby('Backup Job')[x_col].mean().reset_index()
+def plot_avg(cube, x_col, title, x_label):
+    performance = cube_mean(cube, 'Backup Job', [x_col]).reset_index()
 
     fig = px.bar(performance, 
                  x=x_col, 
@@ -136,13 +144,15 @@ def plot_avg(df, x_col, title, x_label):
     return fig
 
 
-def avg_total(df):
-    return plot_avg(df, 'Total Size (GB)', 'Average Total Size for Each Backup Job', 'Average Size (GB)')
+def avg_total(cube):
+    return plot_avg(cube, 'Total Size (GB)', 'Average Total Size for Each Backup Job', 'Average Size (GB)')
 
 
 def size(df):
+    df = downsample(df, 'Start Datetime', 'Total Size (GB)', 'Backup Job')
+
     fig = px.line(df, x='Start Datetime', y='Total Size (GB)', color='Backup Job', 
-                title='Total Size Over Time for Each Backup Job', markers=True)
+                title='Total Size Over Time for Each Backup Job', markers=True, render_mode=render_mode(df))
     
     fig.update_traces(hovertemplate='%{x}<br>%{y} GB') 
 
@@ -152,10 +162,8 @@ def size(df):
     return fig
 
 
-def total_daily_trends(df):
-    daily_trends = df.groupby('Date').agg({
-        'Total Size (GB)': 'sum',
-    }).reset_index()
+def total_daily_trends(cube):
+    daily_trends = cube_sum(cube, 'Date', ['Total Size (GB)']).reset_index()
 
     fig = px.line(daily_trends, x='Date', y='Total Size (GB)',
                 title='Daily Trends of Total Size',
@@ -172,10 +180,8 @@ def total_daily_trends(df):
     return fig
 
 
-def total_hourly_trends(df):
-    hourly_trends = df.groupby('Hour').agg({
-        'Total Size (GB)': 'sum',
-    }).reset_index()
+def total_hourly_trends(cube):
+    hourly_trends = cube_sum(cube, 'Hour', ['Total Size (GB)']).reset_index()
 
     fig = px.line(hourly_trends, x='Hour', y='Total Size (GB)',
                 title='Hourly Trend of Total Size',
@@ -192,12 +198,12 @@ def total_hourly_trends(df):
     return fig
 
 
-def avg_backup(df):
-    return plot_avg(df, 'Backup Size (GB)', 'Average Backup Size for Each Backup Job', 'Average Size (GB)')
+def avg_backup(cube):
+    return plot_avg(cube, 'Backup Size (GB)', 'Average Backup Size for Each Backup Job', 'Average Size (GB)')
 
 
-def heatmap(df):
-    df_aggregated = df.groupby(['Date', 'Backup Job'])['Backup Size (GB)'].sum().reset_index()
+def heatmap(cube):
+    df_aggregated = cube_sum(cube, ['Date', 'Backup Job'], ['Backup Size (GB)']).reset_index()
 
     pivot_table = df_aggregated.pivot(index='Date', columns='Backup Job', values='Backup Size (GB)')
     pivot_table.index = pd.to_datetime(pivot_table.index)
@@ -244,10 +250,8 @@ def heatmap(df):
     return fig
 
 
-def backup_daily_trends(df):
-    daily_trends = df.groupby('Date').agg({
-        'Backup Size (GB)': 'sum',
-    }).reset_index()
+def backup_daily_trends(cube):
+    daily_trends = cube_sum(cube, 'Date', ['Backup Size (GB)']).reset_index()
 
     fig = px.line(daily_trends, x='Date', y='Backup Size (GB)',
                 title='Daily Trends of Backup Size',
@@ -264,10 +268,8 @@ def backup_daily_trends(df):
     return fig
 
 
-def backup_hourly_trends(df):
-    hourly_trends = df.groupby('Hour').agg({
-        'Backup Size (GB)': 'sum',
-    }).reset_index()
+def backup_hourly_trends(cube):
+    hourly_trends = cube_sum(cube, 'Hour', ['Backup Size (GB)']).reset_index()
 
     fig = px.line(hourly_trends, x='Hour', y='Backup Size (GB)',
                 title='Hourly Trend of Backup Size',
@@ -284,18 +286,12 @@ def backup_hourly_trends(df):
     return fig
 
 
-def avg_duration(df):
-    df_copy = df.copy()
-    df_copy['Duration'] = df_copy['Duration'].dt.total_seconds() / 60
-    return plot_avg(df_copy, 'Duration', 'Average Backup Duration for Each Backup Job', 'Average Duration (minutes)')
-
+def avg_duration(cube):
+    return plot_avg(cube, 'Duration (minutes)', 'Average Backup Duration for Each Backup Job', 'Average Duration (minutes)')
 
-def duration_daily_trends(df):
-    daily_trends = df.groupby('Date').agg({
-        'Duration': 'mean',
-    }).reset_index()
 
-    daily_trends['Duration (minutes)'] = daily_trends['Duration'].dt.total_seconds() / 60
+def duration_daily_trends(cube):
+    daily_trends = cube_mean(cube, 'Date', ['Duration (minutes)']).reset_index()
 
     fig = px.line(daily_trends, x='Date', y='Duration (minutes)',
                 title='Daily Trends of Backup Duration',
@@ -312,12 +308,8 @@ def duration_daily_trends(df):
     return fig
 
 
-def duration_hourly_trends(df):
-    hourly_trends = df.groupby('Hour').agg({
-        'Duration': 'mean',
-    }).reset_index()
-
-    hourly_trends['Duration (minutes)'] = hourly_trends['Duration'].dt.total_seconds() / 60
+def duration_hourly_trends(cube):
+    hourly_trends = cube_mean(cube, 'Hour', ['Duration (minutes)']).reset_index()
 
     fig = px.line(hourly_trends, x='Hour', y='Duration (minutes)',
                 title='Hourly Trend of Backup Duration',
@@ -334,36 +326,42 @@ def duration_hourly_trends(df):
     return fig
 
 
-def duration_hist(df):
-    df['Duration (minutes)'] = df['Duration'].dt.total_seconds() / 60
+def density_histogram(df, column, title, color_transparent, color_solid):
+    hist = histogram_density(df[column])
+    edges = hist['edges']
 
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=hist['counts'],
+        width=np.diff(edges),
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        marker=dict(color=color_transparent, line=dict(width=1.5, color=color_solid)),
+        name='Count',
+        hovertemplate=f'{column}=%{{customdata[0]:.2f}} - %{{customdata[1]:.2f}}<br>count=%{{y}}<extra></extra>'
+    ))
+
+    if len(hist['x']):
+        fig.add_trace(go.Scatter(
+            x=hist['x'],
+            y=hist['density'],
+            mode='lines',
+            line=dict(color=color_solid),
+            name='Density',
+            hovertemplate=f'{column}=%{{x}}<br>density=%{{y}}<extra></extra>'
+        ))
+
+    fig.update_layout(title=title, bargap=0)
+
+    return fig
+
+
+def duration_hist(df):
     viridis_color = px.colors.sequential.Viridis[0]
     r, g, b = px.colors.hex_to_rgb(viridis_color)
     rgba_color_transparent = f'rgba({r},{g},{b},0.5)'
     rgba_color_solid = f'rgba({r},{g},{b},1)'
 
-    fig = px.histogram(df, 
-                       x='Duration (minutes)', 
-                       nbins=30,
-                       color_discrete_sequence=[rgba_color_transparent],
-                       title='Distribution of Backup Durations for Backup Jobs')
-
-    for bar in fig.data:
-        bar.marker.line.width = 1.5
-        bar.marker.line.color = rgba_color_solid
-
-    kde = gaussian_kde(df['Duration (minutes)'])
-    x_values = np.linspace(df['Duration (minutes)'].min(), df['Duration (minutes)'].max(), 500)
-    kde_values = kde(x_values)
-
-    fig.add_trace(go.Scatter(
-        x=x_values,
-        y=kde_values * len(df) * (df['Duration (minutes)'].max() - df['Duration (minutes)'].min()) / 30,
-        mode='lines',
-        line=dict(color=rgba_color_solid),
-        name='Density',
-        hovertemplate='Duration (minutes)=%{x}<br>density=%{y}<extra></extra>'
-    ))
+    fig = density_histogram(df, 'Duration (minutes)', 'Distribution of Backup Durations for Backup Jobs', rgba_color_transparent, rgba_color_solid)
 
     fig.update_layout(
         xaxis_title='Duration (minutes)',
@@ -376,11 +374,6 @@ def duration_hist(df):
 
 
 def duration_box(df):
-    df['Duration (minutes)'] = df['Duration'].dt.total_seconds() / 60
-
-    avg_duration = df.groupby('Backup Job')['Duration'].mean().reset_index()
-    avg_duration['Duration'] = avg_duration['Duration'].dt.total_seconds() / 60
-
     fig = px.box(df, x='Duration (minutes)', y='Backup Job',
                 title='Distribution of Backup Durations for Each Backup Job',
                 color='Backup Job',
@@ -398,9 +391,8 @@ def duration_box(df):
     return fig
 
 
-def avg_speed(df):
-    df['Backup Speed (GB/min)'] = df['Data Read (GB)'] / (df['Duration'].dt.total_seconds() / 60)
-    avg_speed = df.groupby('Backup Job')['Backup Speed (GB/min)'].mean().reset_index()
+def avg_speed(cube):
+    avg_speed = cube_mean(cube, 'Backup Job', ['Backup Speed (GB/min)']).reset_index()
 
     fig = px.bar(avg_speed, 
                  x='Backup Speed (GB/min)', 
@@ -423,10 +415,12 @@ def avg_speed(df):
 
 
 def backup_speed(df):
+    df = downsample(df, 'Start Datetime', 'Backup Speed (GB/min)', 'Backup Job')
+
     fig = px.line(df, x='Start Datetime', y='Backup Speed (GB/min)', color='Backup Job', 
                 title='Backup Speed Over Time',
                 labels={'Start datetime': 'Date', 'Backup Speed (GB/min)': 'Backup Speed (GB/min)'},
-                markers=True)
+                markers=True, render_mode=render_mode(df))
     
     fig.update_traces(hovertemplate='%{x}<br>%{y} GB/min')
 
@@ -439,28 +433,7 @@ def speed_hist(df):
     rgba_color_transparent = f'rgba({r},{g},{b},0.5)'
     rgba_color_solid = f'rgba({r},{g},{b},1)'
 
-    fig = px.histogram(df, 
-                       x='Backup Speed (GB/min)', 
-                       nbins=30,
-                       color_discrete_sequence=[rgba_color_transparent],
-                       title='Distribution of Backup Speed for Backup Jobs')
-    
-    for bar in fig.data:
-        bar.marker.line.width = 1.5
-        bar.marker.line.color = rgba_color_solid
-    
-    kde = gaussian_kde(df['Backup Speed (GB/min)'])
-    x_values = np.linspace(df['Backup Speed (GB/min)'].min(), df['Backup Speed (GB/min)'].max(), 500)
-    kde_values = kde(x_values)
-
-    fig.add_trace(go.Scatter(
-        x=x_values,
-        y=kde_values * len(df) * (df['Backup Speed (GB/min)'].max() - df['Backup Speed (GB/min)'].min()) / 30,
-        mode='lines',
-        line=dict(color=rgba_color_solid),
-        name='Density',
-        hovertemplate='Duration (minutes)=%{x}<br>density=%{y}<extra></extra>'
-    ))
+    fig = density_histogram(df, 'Backup Speed (GB/min)', 'Distribution of Backup Speed for Backup Jobs', rgba_color_transparent, rgba_color_solid)
 
     fig.update_layout(
         xaxis_title='Duration (minutes)',
@@ -490,13 +463,10 @@ def speed_box(df):
     return fig
 
 
-def speed_heatmap(df):
-    df['Day of Week'] = pd.to_datetime(df['Date']).dt.day_name()
+def speed_heatmap(cube):
+    day_order = DAY_OF_WEEK.categories
 
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    df['Day of Week'] = pd.Categorical(df['Day of Week'], categories=day_order, ordered=True)
-
-    heatmap_data = df.pivot_table(values='Backup Speed (GB/min)', index='Day of Week', columns='Hour', aggfunc='mean', observed=False)
+    heatmap_data = cube_mean(cube, ['Day of Week', 'Hour'], ['Backup Speed (GB/min)'])['Backup Speed (GB/min)'].dropna().unstack('Hour')
 
     required_columns = set(range(24))
     existing_columns = set(heatmap_data.columns)
@@ -543,67 +513,63 @@ def speed_heatmap(df):
     return fig
 
 
-def perfomance(df):
-    figs = []
-    backup_jobs = df['Backup Job'].unique()
-    palette = sns.color_palette("bright", 5).as_hex()
+def entity_frames(df, entity, names):
+    selected = df[df[entity].isin(names)].sort_values(by='Start Datetime', kind='stable')
+    frames = dict(tuple(selected.groupby(entity, observed=True, sort=False)))
 
-    for job in backup_jobs:
-        job_df = df[df['Backup Job'] == job]
-        job_df = job_df.sort_values(by='Start Datetime')
+    return [(name, frames[name]) for name in names if name in frames]
 
-        fig = make_subplots(rows=1, cols=2, 
-                            subplot_titles=(f'Backup Size, Data Read, Transferred', 
-                                            f'Dedupe and Compression'),
-                            shared_xaxes=True)
-        
-        fig.add_trace(go.Scatter(x=job_df['Start Datetime'], 
-                                 y=job_df['Backup Size (GB)'],
-                                 mode='lines+markers',
-                                 name='Backup Size (GB)',
-                                 marker=dict(color=palette[0])),
-                      row=1, col=1)
-        fig.add_trace(go.Scatter(x=job_df['Start Datetime'], 
-                                 y=job_df['Data Read (GB)'],
-                                 mode='lines+markers',
-                                 name='Data Read (GB)',
-                                 marker=dict(color=palette[1])),
-                      row=1, col=1)
-        fig.add_trace(go.Scatter(x=job_df['Start Datetime'], 
-                                 y=job_df['Transferred (GB)'],
-                                 mode='lines+markers',
-                                 name='Transferred (GB)',
-                                 marker=dict(color=palette[2])),
-                      row=1, col=1)
 
+def add_performance_traces(fig, job_df, row, palette, showlegend=True):
+    metrics = [(metric, 1) for metric in PERFORMANCE_SIZES] + [(metric, 2) for metric in PERFORMANCE_RATIOS]
+
+    for color, (metric, col) in zip(palette, metrics):
         fig.add_trace(go.Scatter(x=job_df['Start Datetime'], 
-                                 y=job_df['Dedupe'],
-                                 mode='lines+markers',
-                                 name='Dedupe',
-                                 marker=dict(color=palette[3])),
-                      row=1, col=2)
-        fig.add_trace(go.Scatter(x=job_df['Start Datetime'], 
-                                 y=job_df['Compression'],
+                                 y=job_df[metric],
                                  mode='lines+markers',
-                                 name='Compression',
-                                 marker=dict(color=palette[4])),
-                      row=1, col=2)
-        
+                                 name=metric,
+                                 legendgroup=metric,
+                                 showlegend=showlegend,
+                                 marker=dict(color=color)),
+                      row=row, col=col)
+
+
+def perfomance(df, jobs):
+    frames = entity_frames(df, 'Backup Job', jobs)
+    palette = sns.color_palette("bright", 5).as_hex()
+
+    if len(frames) == 1:
+        titles = PERFORMANCE_TITLES
+    else:
+        titles = [f'{job} - {title}' for job, _ in frames for title in PERFORMANCE_TITLES]
+
+    fig = make_subplots(rows=max(len(frames), 1), cols=2, 
+                        subplot_titles=titles,
+                        shared_xaxes=True)
+
+    for row, (job, job_df) in enumerate(frames, 1):
+        add_performance_traces(fig, job_df, row, palette, showlegend=row == 1)
+
+    if len(frames) == 1:
         fig.update_layout(
-            title_text=job,
+            title_text=frames[0][0],
             showlegend=True,
             legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="left", x=0),
         )
+    else:
+        fig.update_layout(
+            height=FACET_HEIGHT * max(len(frames), 1),
+            showlegend=True,
+            legend=dict(orientation="h", yanchor="bottom", y=1, xanchor="left", x=0),
+        )
 
-        fig.update_xaxes(tickformat='%d-%m %H:%M', tickangle=30)
-
-        figs.append(fig)
+    fig.update_xaxes(tickformat='%d-%m %H:%M', tickangle=30)
 
-    return figs
+    return fig
 
 
-def dedupe_efficiency(df):
-    df_jobs = df.groupby('Backup Job')[['Backup Size (GB)', 'Dedupe']].mean().reset_index()
+def dedupe_efficiency(cube):
+    df_jobs = cube_mean(cube, 'Backup Job', ['Backup Size (GB)', 'Dedupe']).reset_index()
     fig = px.scatter(df_jobs, x='Backup Size (GB)', y='Dedupe', color='Backup Job', 
                     title='Efficiency of Deduplication vs Backup Size',
                     labels={'Backup Size (GB)': 'Backup Size (GB)', 'Dedupe': 'Dedupe Ratio'})
@@ -613,8 +579,8 @@ def dedupe_efficiency(df):
     return fig
 
 
-def compression_efficiency(df):
-    df_jobs = df.groupby('Backup Job')[['Backup Size (GB)', 'Compression']].mean().reset_index()
+def compression_efficiency(cube):
+    df_jobs = cube_mean(cube, 'Backup Job', ['Backup Size (GB)', 'Compression']).reset_index()
     fig = px.scatter(df_jobs, x='Backup Size (GB)', y='Compression', color='Backup Job', 
                     title='Efficiency of Compression vs Backup Size',
                     labels={'Backup Size (GB)': 'Backup Size (GB)', 'Compression': 'Compression Ratio'})
@@ -641,8 +607,8 @@ def gantt(df):
     return fig
 
 
-def status_by_obj(df):
-    summary = df.groupby('Object')[['Success', 'Warning', 'Error']].sum().reset_index()
+def status_by_obj(cube):
+    summary = cube_sum(cube, 'Object', ['Success', 'Warning', 'Error']).reset_index()
     summary_long = summary.melt(id_vars='Object', value_vars=['Success', 'Warning', 'Error'], 
                                 var_name='Status', value_name='Count')
 
@@ -663,8 +629,8 @@ def status_by_obj(df):
     return fig
 
 
-def error_obj(df):
-    backup_stats = df.groupby('Object')[['Success', 'Error', 'Warning']].sum().reset_index()
+def error_obj(cube):
+    backup_stats = cube_sum(cube, 'Object', ['Success', 'Error', 'Warning']).reset_index()
     backup_stats['Total'] = backup_stats['Error'] + backup_stats['Success'] + backup_stats['Warning']
     backup_stats['Error Rate'] = backup_stats['Error'] / backup_stats['Total']
 
@@ -689,8 +655,8 @@ def error_obj(df):
     return fig
 
 
-def plot_avg_obj(df, x_col, title, x_label):
-    performance = df.groupby('Object')[x_col].mean().reset_index()
+def plot_avg_obj(cube, x_col, title, x_label):
+    performance = cube_mean(cube, 'Object', [x_col]).reset_index()
 
     fig = px.bar(performance, 
                  x=x_col, 
@@ -712,13 +678,15 @@ def plot_avg_obj(df, x_col, title, x_label):
     return fig
 
 
-def avg_total_obj(df):
-    return plot_avg_obj(df, 'Size (GB)', 'Average Total Size for Each Object', 'Average Size (GB)')
+def avg_total_obj(cube):
+    return plot_avg_obj(cube, 'Size (GB)', 'Average Total Size for Each Object', 'Average Size (GB)')
 
 
 def size_obj(df):
+    df = downsample(df, 'Start Datetime', 'Size (GB)', 'Object')
+
     fig = px.line(df, x='Start Datetime', y='Size (GB)', color='Object', 
-                title='Total Size Over Time for Each Object', markers=True)
+                title='Total Size Over Time for Each Object', markers=True, render_mode=render_mode(df))
     
     fig.update_traces(hovertemplate='%{x}<br>%{y} GB') 
 
@@ -728,42 +696,17 @@ def size_obj(df):
     return fig
 
 
-def avg_duration_obj(df):
-    df_copy = df.copy()
-    df_copy['Duration'] = df_copy['Duration'].dt.total_seconds() / 60
-    return plot_avg_obj(df_copy, 'Duration', 'Average Backup Duration for Each Backup Job', 'Average Duration (minutes)')
+def avg_duration_obj(cube):
+    return plot_avg_obj(cube, 'Duration (minutes)', 'Average Backup Duration for Each Backup Job', 'Average Duration (minutes)')
 
 
 def duration_hist_obj(df):
-    df['Duration (minutes)'] = df['Duration'].dt.total_seconds() / 60
-
     viridis_color = px.colors.sequential.Viridis[0]
     r, g, b = px.colors.hex_to_rgb(viridis_color)
     rgba_color_transparent = f'rgba({r},{g},{b},0.5)'
     rgba_color_solid = f'rgba({r},{g},{b},1)'
 
-    fig = px.histogram(df, 
-                       x='Duration (minutes)', 
-                       nbins=30,
-                       color_discrete_sequence=[rgba_color_transparent],
-                       title='Distribution of Backup Durations for Objects')
-    
-    for bar in fig.data:
-        bar.marker.line.width = 1.5
-        bar.marker.line.color = rgba_color_solid
-    
-    kde = gaussian_kde(df['Duration (minutes)'])
-    x_values = np.linspace(df['Duration (minutes)'].min(), df['Duration (minutes)'].max(), 500)
-    kde_values = kde(x_values)
-
-    fig.add_trace(go.Scatter(
-        x=x_values,
-        y=kde_values * len(df) * (df['Duration (minutes)'].max() - df['Duration (minutes)'].min()) / 30,
-        mode='lines',
-        line=dict(color=rgba_color_solid),
-        name='Density',
-        hovertemplate='Duration (minutes)=%{x}<br>density=%{y}<extra></extra>'
-    ))
+    fig = density_histogram(df, 'Duration (minutes)', 'Distribution of Backup Durations for Objects', rgba_color_transparent, rgba_color_solid)
 
     fig.update_layout(
         xaxis_title='Duration (minutes)',
@@ -776,11 +719,6 @@ def duration_hist_obj(df):
 
 
 def duration_box_obj(df):
-    df['Duration (minutes)'] = df['Duration'].dt.total_seconds() / 60
-
-    avg_duration = df.groupby('Object')['Duration'].mean().reset_index()
-    avg_duration['Duration'] = avg_duration['Duration'].dt.total_seconds() / 60
-
     fig = px.box(df, x='Duration (minutes)', y='Object', orientation='h',
                 title='Distribution of Backup Durations for Each Object',
                 color='Object',
@@ -797,9 +735,8 @@ def duration_box_obj(df):
     return fig
 
 
-def avg_speed_obj(df):
-    df['Backup Speed (GB/min)'] = np.where(df['Duration'].dt.total_seconds() == 0, 0, df['Read (GB)'] / (df['Duration'].dt.total_seconds() / 60))
-    avg_speed = df.groupby('Object')['Backup Speed (GB/min)'].mean().reset_index()
+def avg_speed_obj(cube):
+    avg_speed = cube_mean(cube, 'Object', ['Backup Speed (GB/min)']).reset_index()
 
     fig = px.bar(avg_speed, 
                  x='Backup Speed (GB/min)', 
@@ -822,10 +759,12 @@ def avg_speed_obj(df):
 
 
 def backup_speed_obj(df):
+    df = downsample(df, 'Start Datetime', 'Backup Speed (GB/min)', 'Object')
+
     fig = px.line(df, x='Start Datetime', y='Backup Speed (GB/min)', color='Object', 
                 title='Backup Speed Over Time',
                 labels={'Start datetime': 'Date', 'Backup Speed (GB/min)': 'Backup Speed (GB/min)'},
-                markers=True)
+                markers=True, render_mode=render_mode(df))
     
     fig.update_traces(hovertemplate='%{x}<br>%{y} GB/min')
 
@@ -838,28 +777,7 @@ def speed_hist_obj(df):
     rgba_color_transparent = f'rgba({r},{g},{b},0.5)'
     rgba_color_solid = f'rgba({r},{g},{b},1)'
 
-    fig = px.histogram(df, 
-                       x='Backup Speed (GB/min)', 
-                       nbins=30,
-                       color_discrete_sequence=[rgba_color_transparent],
-                       title='Distribution of Backup Speed for Objects')
-    
-    for bar in fig.data:
-        bar.marker.line.width = 1.5
-        bar.marker.line.color = rgba_color_solid
-    
-    kde = gaussian_kde(df['Backup Speed (GB/min)'])
-    x_values = np.linspace(df['Backup Speed (GB/min)'].min(), df['Backup Speed (GB/min)'].max(), 500)
-    kde_values = kde(x_values)
-
-    fig.add_trace(go.Scatter(
-        x=x_values,
-        y=kde_values * len(df) * (df['Backup Speed (GB/min)'].max() - df['Backup Speed (GB/min)'].min()) / 30,
-        mode='lines',
-        line=dict(color=rgba_color_solid),
-        name='Density',
-        hovertemplate='Duration (minutes)=%{x}<br>density=%{y}<extra></extra>'
-    ))
+    fig = density_histogram(df, 'Backup Speed (GB/min)', 'Distribution of Backup Speed for Objects', rgba_color_transparent, rgba_color_solid)
 
     fig.update_layout(
         xaxis_title='Duration (minutes)',
@@ -888,33 +806,43 @@ def speed_box_obj(df):
     return fig
 
 
-def perfomance_obj(df):
-    figs = []
-    backup_objs = df['Object'].unique()
+def perfomance_obj(df, objs):
+    frames = entity_frames(df, 'Object', objs)
     palette = sns.color_palette("bright", 5).as_hex()
 
-    for obj in backup_objs:
-        obj_df = df[df['Object'] == obj]
-        obj_df = obj_df.sort_values(by='Start Datetime')
-
- 
-        fig = px.line(obj_df, x='Start Datetime', 
-                    y=['Read (GB)', 'Transferred (GB)'],
-                    title=f'{obj} - Read, Transferred',
-                    labels={'value': 'Size (GB)', 'variable': 'Metric'},
-                    markers=True,
-                    color_discrete_sequence=palette[:2])
-        
-        fig.update_traces(hovertemplate='%{x}<br>%{y} GB')
+    if len(frames) == 1:
+        obj, obj_df = frames[0]
+        title, facets = f'{obj} - Read, Transferred', {}
+    else:
+        obj_df = pd.concat([obj_df for _, obj_df in frames]) if frames else df.iloc[0:0]
+        obj_df = obj_df.assign(Object=obj_df['Object'].astype(str))
+        rows = -(-len(frames) // FACET_COLUMNS)
+        title = 'Read, Transferred'
+        facets = dict(facet_col='Object', facet_col_wrap=FACET_COLUMNS, height=FACET_HEIGHT * max(rows, 1),
+                      category_orders={'Object': [str(obj) for obj, _ in frames]})
+
+    fig = px.line(obj_df, x='Start Datetime', 
+                y=['Read (GB)', 'Transferred (GB)'],
+                title=title,
+                labels={'value': 'Size (GB)', 'variable': 'Metric'},
+                markers=True,
+                color_discrete_sequence=palette[:2],
+                **facets)
+    
+    fig.update_traces(hovertemplate='%{x}<br>%{y} GB')
 
-        fig.update_layout(
-            xaxis=dict(tickformat='%d-%m %H:%M', tickangle=30),
-            legend=dict(orientation="h", yanchor="top", y=-0.4, xanchor="left", x=0)
-        )
+    fig.update_layout(
+        xaxis=dict(tickformat='%d-%m %H:%M', tickangle=30),
+        legend=dict(orientation="h", yanchor="top", y=-0.4, xanchor="left", x=0)
+    )
 
-        figs.append(fig)
+    if facets:
+        fig.update_xaxes(tickformat='%d-%m %H:%M', tickangle=30)
+        fig.update_yaxes(matches=None, showticklabels=True)
+        fig.for_each_annotation(lambda annotation: annotation.update(text=annotation.text.split('=', 1)[-1]))
+        fig.update_layout(legend=dict(yanchor="bottom", y=1))
 
-    return figs
+    return fig
 
 
 # def heatmap_obj(df):
@@ -953,8 +881,8 @@ def perfomance_obj(df):
 #     st.plotly_chart(fig, use_container_width=True)
 
 
-def efficiency_obj(df):
-    df_objects = df.groupby('Object')[['Transferred (GB)', 'Read (GB)']].sum().reset_index()
+def efficiency_obj(cube):
+    df_objects = cube_sum(cube, 'Object', ['Transferred (GB)', 'Read (GB)']).reset_index()
     df_objects['Efficiency'] = df_objects['Read (GB)'] / df_objects['Transferred (GB)']
 
     fig = px.scatter(df_objects, x='Transferred (GB)', y='Efficiency', color='Object', 
@@ -966,49 +894,72 @@ def efficiency_obj(df):
     return fig
 
 
-def generate_all_charts(backup, obj):
-    charts = {
-                'status': status(backup),
-                'status_by_backup': status_by_backup(backup),
-                'error': error(backup),
-                'error_daily': error_daily(backup),
-                'error_hour': error_hour(backup),
-                'avg_total': avg_total(backup),
-                'size': size(backup),
-                'total_daily_trends': total_daily_trends(backup),
-                'total_hourly_trends': total_hourly_trends(backup),
-                'avg_backup': avg_backup(backup),
-                'heatmap': heatmap(backup),
-                'backup_daily_trends': backup_daily_trends(backup),
-                'backup_hourly_trends': backup_hourly_trends(backup),
-                'avg_duration': avg_duration(backup),
-                'duration_daily_trends': duration_daily_trends(backup),
-                'duration_hourly_trends': duration_hourly_trends(backup),
-                'duration_hist': duration_hist(backup),
-                'duration_box': duration_box(backup),
-                'avg_speed': avg_speed(backup),
-                'backup_speed': backup_speed(backup),
-                'speed_hist': speed_hist(backup),
-                'speed_box': speed_box(backup),
-                'speed_heatmap': speed_heatmap(backup),
-                'performance': perfomance(backup),
-                'dedupe_efficiency': dedupe_efficiency(backup),
-                'compression_efficiency': compression_efficiency(backup),
-                'gantt': gantt(backup),
-                'status_obj': status(obj),
-                'status_by_obj': status_by_obj(obj),
-                'error_obj': error_obj(obj),
-                'avg_total_obj': avg_total_obj(obj),
-                'size_obj': size_obj(obj),
-                'avg_duration_obj': avg_duration_obj(obj),
-                'duration_hist_obj': duration_hist_obj(obj),
-                'duration_box_obj': duration_box_obj(obj),
-                'avg_speed_obj': avg_speed_obj(obj),
-                'backup_speed_obj': backup_speed_obj(obj),
-                'speed_hist_obj': speed_hist_obj(obj),
-                'speed_box_obj': speed_box_obj(obj),
-                'perfomance_obj': perfomance_obj(obj),
-                'efficiency_obj': efficiency_obj(obj)
-    }
-
-    return charts
\ No newline at end of file
+CHARTS = {
+    'status': (status, 'backup_cube'),
+    'status_by_backup': (status_by_backup, 'backup_cube'),
+    'error': (error, 'backup_cube'),
+    'error_daily': (error_daily, 'backup_cube'),
+    'error_hour': (error_hour, 'backup_cube'),
+    'avg_total': (avg_total, 'backup_cube'),
+    'size': (size, 'backup'),
+    'total_daily_trends': (total_daily_trends, 'backup_cube'),
+    'total_hourly_trends': (total_hourly_trends, 'backup_cube'),
+    'avg_backup': (avg_backup, 'backup_cube'),
+    'heatmap': (heatmap, 'backup_cube'),
+    'backup_daily_trends': (backup_daily_trends, 'backup_cube'),
+    'backup_hourly_trends': (backup_hourly_trends, 'backup_cube'),
+    'avg_duration': (avg_duration, 'backup_cube'),
+    'duration_daily_trends': (duration_daily_trends, 'backup_cube'),
+    'duration_hourly_trends': (duration_hourly_trends, 'backup_cube'),
+    'duration_hist': (duration_hist, 'backup'),
+    'duration_box': (duration_box, 'backup'),
+    'avg_speed': (avg_speed, 'backup_cube'),
+    'backup_speed': (backup_speed, 'backup'),
+    'speed_hist': (speed_hist, 'backup'),
+    'speed_box': (speed_box, 'backup'),
+    'speed_heatmap': (speed_heatmap, 'backup_cube'),
+    'dedupe_efficiency': (dedupe_efficiency, 'backup_cube'),
+    'compression_efficiency': (compression_efficiency, 'backup_cube'),
+    'gantt': (gantt, 'backup'),
+    'status_obj': (status, 'obj_cube'),
+    'status_by_obj': (status_by_obj, 'obj_cube'),
+    'error_obj': (error_obj, 'obj_cube'),
+    'avg_total_obj': (avg_total_obj, 'obj_cube'),
+    'size_obj': (size_obj, 'obj'),
+    'avg_duration_obj': (avg_duration_obj, 'obj_cube'),
+    'duration_hist_obj': (duration_hist_obj, 'obj'),
+    'duration_box_obj': (duration_box_obj, 'obj'),
+    'avg_speed_obj': (avg_speed_obj, 'obj_cube'),
+    'backup_speed_obj': (backup_speed_obj, 'obj'),
+    'speed_hist_obj': (speed_hist_obj, 'obj'),
+    'speed_box_obj': (speed_box_obj, 'obj'),
+    'efficiency_obj': (efficiency_obj, 'obj_cube')
+}
+
+
+PERFORMANCE_CHARTS = {
+    'performance': (perfomance, 'backup', 'Backup Job', len(PERFORMANCE_SIZES + PERFORMANCE_RATIOS)),
+    'perfomance_obj': (perfomance_obj, 'obj', 'Object', 2)
+}
+
+
+def generate_chart(name, data):
+    chart, source = CHARTS[name]
+
+    return chart(data[source])
+
+
+def performance_entities(name, data):
+    _, source, entity, _ = PERFORMANCE_CHARTS[name]
+
+    return data[source][entity].dropna().unique().tolist()
+
+
+def performance_page_size(name):
+    return max(MAX_FACET_TRACES // PERFORMANCE_CHARTS[name][3], 1)
+
+
+def generate_performance_chart(name, entities, data):
+    chart, source, _, _ = PERFORMANCE_CHARTS[name]
+
+    return chart(data[source], list(entities))
@@ -1,26 +1,37 @@
 import pandas as pd
-from datetime import datetime
+import numpy as np
+from utils.schema import DAY_OF_WEEK, remove_unused_categories
     
 
-def convert_to_gb(size):
-    if size == "0 B":
-        return 0.0
-    number, unit = size.split()
-    number = float(number.replace(',', '.'))
-    unit_conversion = {
-        'TB': 1024,
-        'GB': 1,
-        'MB': 1 / 1024,
-        'KB': 1 / (1024 * 1024),
-        'B': 1 / (1024 * 1024 * 1024)
-    }
-    return number * unit_conversion.get(unit, 0)
-
-
-def apply_to_df(df, columns):
-    for column in columns:
-        df[f'{column} (GB)'] = df[column].apply(convert_to_gb)
-        df.drop([column], axis=1, inplace=True)
+SIZE_PATTERN = r'^\s*(\d+(?:[.,]\d+)?)\s*([A-Za-z]+)\s*$'
+SIZE_UNITS = ['TB', 'GB', 'MB', 'KB', 'B']
+SIZE_UNIT_TO_GB = np.array([1024, 1, 1 / 1024, 1 / (1024 * 1024), 1 / (1024 * 1024 * 1024), np.nan])
+
+STATUSES = ['Success', 'Warning', 'Error']
+
+
+def convert_to_gb(sizes):
+    codes, uniques = pd.factorize(sizes)
+
+    parts = pd.Series(uniques, dtype=object).astype(str).str.extract(SIZE_PATTERN)
+    numbers = parts[0].str.replace(',', '.', regex=False).astype(float).to_numpy()
+    units = pd.Index(SIZE_UNITS).get_indexer(parts[1])
+
+    sizes_gb = np.append(numbers * SIZE_UNIT_TO_GB[units], np.nan)
+
+    return sizes_gb[codes]
+
+
+def apply_to_df(frames):
+    values = np.concatenate([df[column].to_numpy(dtype=object) for df, columns in frames for column in columns])
+    sizes_gb = convert_to_gb(values)
+
+    offset = 0
+    for df, columns in frames:
+        for column in columns:
+            df[f'{column} (GB)'] = sizes_gb[offset:offset + len(df)]
+            offset += len(df)
+        df.drop(columns, axis=1, inplace=True)
     
 
 def remove_x_and_convert(value):
@@ -28,39 +39,56 @@ def remove_x_and_convert(value):
 
 
 def convert(df):
-    df['Date'] = pd.to_datetime(df['Date']).dt.strftime('%Y-%m-%d')
-    df['Start Time'] = pd.to_datetime(df['Start Time'], format='%H:%M:%S')
-    for index, row in df.iterrows():
-        if isinstance(df.at[index, 'End Time'], str):
-            df.at[index, 'End Time'] = df.at[index, 'End Time'][:8]
-    df['End Time'] = pd.to_datetime(df['End Time'], format='%H:%M:%S').dt.time
-    df['Duration'] = df['Duration'].apply(lambda row: pd.to_timedelta(row.strftime('%H:%M:%S')))
+    df['Date'] = pd.to_datetime(df['Date'])
+
+
+def combine_datetime(dates, times):
+    return dates + times
+
+
+def status_flags(df):
+    codes = pd.Categorical(df['Status'], categories=STATUSES).codes
+    flags = (codes[:, np.newaxis] == np.arange(len(STATUSES))).astype(int)
+
+    for i, status in enumerate(STATUSES):
+        df[status] = flags[:, i]
 
 
 def useful_cols(df):
-    df['Hour'] = pd.to_datetime(df['Start Time'], format='%H:%M:%S').dt.hour
-    df['Start Datetime'] = df.apply(lambda row: datetime.combine(pd.to_datetime(row['Date']), pd.to_datetime(row['Start Time'], format='%H:%M:%S').time()), axis=1)
-    df['End Datetime'] = df.apply(lambda row: datetime.combine(pd.to_datetime(row['Date']), pd.to_datetime(row['End Time'], format='%H:%M:%S').time()), axis=1)
+    df['Hour'] = df['Start Time'].dt.components['hours']
+    df['Day of Week'] = pd.Categorical.from_codes(df['Date'].dt.dayofweek, dtype=DAY_OF_WEEK)
+    df['Start Datetime'] = combine_datetime(df['Date'], df['Start Time'])
+    df['Duration (minutes)'] = df['Duration'].dt.total_seconds() / 60
+    df['Backup Speed (GB/min)'] = df['Data Read (GB)'] / df['Duration (minutes)']
+
+    end_datetime = combine_datetime(df['Date'], df['End Time'])
+    rollover = (end_datetime < df['Start Datetime']).astype(int) + df['Duration'].dt.days.fillna(0).astype(int)
+    df['End Datetime'] = end_datetime + pd.to_timedelta(rollover, unit='D')
 
 def useful_cols_obj(df):
-    df['Success'] = df['Status'].apply(lambda x: 1 if x == 'Success' else 0)
-    df['Warning'] = df['Status'].apply(lambda x: 1 if x == 'Warning' else 0)
-    df['Error'] = df['Status'].apply(lambda x: 1 if x == 'Error' else 0)
-    df['Start Datetime'] = df.apply(lambda row: datetime.combine(pd.to_datetime(row['Date']), pd.to_datetime(row['Start Time'], format='%H:%M:%S').time()), axis=1)
+    status_flags(df)
+    df['Start Datetime'] = combine_datetime(df['Date'], df['Start Time'])
+    df['Duration (minutes)'] = df['Duration'].dt.total_seconds() / 60
+    df['Backup Speed (GB/min)'] = np.where(df['Duration (minutes)'] == 0, 0, df['Read (GB)'] / df['Duration (minutes)'])
 
 
 def process_data(backup_df, obj_df, last_backup_df, last_obj_df):
     backup_copy, obj_copy, last_backup_copy, last_obj_copy = backup_df.copy(), obj_df.copy(), last_backup_df.copy(), last_obj_df.copy()
 
+    for df in (backup_copy, obj_copy, last_backup_copy, last_obj_copy):
+        remove_unused_categories(df)
+
     convert(backup_copy)
     convert(obj_copy)
     convert(last_backup_copy)
     convert(last_obj_copy)
 
-    apply_to_df(backup_copy, ['Total Size', 'Backup Size', 'Data Read', 'Transferred'])
-    apply_to_df(last_backup_copy, ['Total Size', 'Backup Size', 'Data Read', 'Transferred'])
-    apply_to_df(obj_copy, ['Size', 'Read', 'Transferred'])
-    apply_to_df(last_obj_copy, ['Size', 'Read', 'Transferred'])
+    apply_to_df([
+        (backup_copy, ['Total Size', 'Backup Size', 'Data Read', 'Transferred']),
+        (last_backup_copy, ['Total Size', 'Backup Size', 'Data Read', 'Transferred']),
+        (obj_copy, ['Size', 'Read', 'Transferred']),
+        (last_obj_copy, ['Size', 'Read', 'Transferred'])
+    ])
 
     backup_copy['Dedupe'] = backup_copy['Dedupe'].apply(remove_x_and_convert)
     backup_copy['Compression'] = backup_copy['Compression'].apply(remove_x_and_convert)
@@ -0,0 +1,87 @@
+import re
+import calendar
+from datetime import datetime
+from functools import lru_cache
+from dateutil import parser
+
+
+MONTH_NAMES = {
+    'en': [
+        ('january', 'jan'), ('february', 'feb'), ('march', 'mar'), ('april', 'apr'),
+        ('may',), ('june', 'jun'), ('july', 'jul'), ('august', 'aug'),
+        ('september', 'sep', 'sept'), ('october', 'oct'), ('november', 'nov'), ('december', 'dec')
+    ],
+    'pl': [
+        ('stycznia', 'styczeń'), ('lutego', 'luty'), ('marca', 'marzec'), ('kwietnia', 'kwiecień'),
+        ('maja', 'maj'), ('czerwca', 'czerwiec'), ('lipca', 'lipiec'), ('sierpnia', 'sierpień'),
+        ('września', 'wrzesień'), ('października', 'październik'), ('listopada', 'listopad'), ('grudnia', 'grudzień')
+    ]
+}
+
+MONTHS = {name: month for names in MONTH_NAMES.values() for month, forms in enumerate(names, 1) for name in forms}
+
+MONTH_ALTERNATION = '|'.join(sorted(map(re.escape, MONTHS), key=len, reverse=True))
+MONTH_PATTERN = re.compile(rf'\b(?:{MONTH_ALTERNATION})\b', re.IGNORECASE)
+
+HEADER_PATTERN = re.compile(
+    rf'(?:(?P<day>\d{{1,2}})\.?\s+(?P<month>{MONTH_ALTERNATION})|(?P<month_first>{MONTH_ALTERNATION})\.?\s+(?P<day_second>\d{{1,2}}),?)'
+    r'\s+(?P<year>\d{4}),?\s+(?P<hour>\d{1,2}):(?P<minute>\d{2}):(?P<second>\d{2})(?:\s*(?P<meridiem>[AP]M))?\b',
+    re.IGNORECASE
+)
+
+YEAR_FIRST_PATTERN = re.compile(r'\d{4}\D')
+
+CACHE_SIZE = 4096
+
+
+def replace_months(date_str):
+    return MONTH_PATTERN.sub(lambda match: calendar.month_name[MONTHS[match.group().lower()]], date_str)
+
+
+def parse_fallback(text):
+    date_str = replace_months(text.split(',')[-1].strip())
+
+    if YEAR_FIRST_PATTERN.match(date_str):
+        return parser.parse(date_str, yearfirst=True)
+
+    return parser.parse(date_str, dayfirst=True)
+
+
+def parse_exact(text):
+    parts = text.rpartition(',')[2].split()
+    if len(parts) != 4:
+        return None
+
+    day, month_name, year, time = parts
+    month = MONTHS.get(month_name.lower())
+    clock = time.split(':')
+
+    if month is None or len(clock) != 3 or not (day + year + ''.join(clock)).isdigit():
+        return None
+
+    return datetime(int(year), month, int(day), int(clock[0]), int(clock[1]), int(clock[2]))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_header_date(text):
+    parsed_date = parse_exact(text)
+    if parsed_date is not None:
+        return parsed_date
+
+    match = HEADER_PATTERN.search(text)
+
+    if match is None:
+        return parse_fallback(text)
+
+    hour = int(match['hour'])
+    if match['meridiem']:
+        hour = hour % 12 + (12 if match['meridiem'].upper() == 'PM' else 0)
+
+    return datetime(
+        int(match['year']),
+        MONTHS[(match['month'] or match['month_first']).lower()],
+        int(match['day'] or match['day_second']),
+        hour,
+        int(match['minute']),
+        int(match['second'])
+    )
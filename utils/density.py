@@ -0,0 +1,50 @@
+import numpy as np
+from scipy.signal import fftconvolve
+
+
+BINS = 30
+KDE_RESOLUTION = 16
+
+
+def scott_bandwidth(values):
+    return values.std(ddof=1) * len(values) ** (-1 / 5)
+
+
+def binned_kde(counts, step, bandwidth):
+    offsets = np.arange(-(len(counts) - 1), len(counts)) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+
+    return np.maximum(fftconvolve(counts, kernel, mode='valid'), 0)
+
+
+def histogram(edges, counts, x=np.empty(0), density=np.empty(0)):
+    return {'edges': edges, 'counts': counts, 'x': x, 'density': density}
+
+
+def histogram_density(values, bins=BINS, resolution=KDE_RESOLUTION):
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+
+    if not len(values):
+        return histogram(np.empty(0), np.empty(0, dtype=np.int64))
+
+    low, high = values.min(), values.max()
+
+    if low == high:
+        return histogram(np.array([low - 0.5, high + 0.5]), np.array([len(values)]))
+
+    fine_bins = bins * resolution
+    step = (high - low) / fine_bins
+    fine_counts = np.bincount(np.minimum(((values - low) / step).astype(np.int64), fine_bins - 1), minlength=fine_bins)
+
+    edges = np.linspace(low, high, bins + 1)
+    counts = fine_counts.reshape(bins, resolution).sum(axis=1)
+    x = low + (np.arange(fine_bins) + 0.5) * step
+
+    bandwidth = scott_bandwidth(values)
+    if not bandwidth > 0:
+        return histogram(edges, counts)
+
+    density = binned_kde(fine_counts.astype(np.float64), step, bandwidth) * (edges[1] - edges[0])
+
+    return histogram(edges, counts, x, density)
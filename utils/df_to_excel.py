@@ -2,17 +2,36 @@ import pandas as pd
 from openpyxl import load_workbook, Workbook
 from utils.formatting import format_backup, format_execution
 from utils.stats import stats_excel
+from utils.schema import format_times
+from pandas.api.types import is_timedelta64_dtype
 import shutil
 import os
 
 
+TIME_FORMAT = '[h]:mm:ss'
+
+
 def adjust_column_widths(writer, dataframe, sheet_name):
     worksheet = writer.sheets[sheet_name]
+    display_df = format_times(dataframe)
+
     for idx, col in enumerate(dataframe.columns):
-        max_len = max(dataframe[col].astype(str).map(len).max(), len(col)) + 2
+        max_len = max(display_df[col].astype(str).map(len).max(), len(col)) + 2
         worksheet.set_column(idx, idx, max_len)
 
 
+def write_time_columns(writer, dataframe, sheet_name):
+    worksheet = writer.sheets[sheet_name]
+    time_format = writer.book.add_format({'num_format': TIME_FORMAT})
+
+    for idx, col in enumerate(dataframe.columns):
+        if is_timedelta64_dtype(dataframe[col]):
+            days = dataframe[col].dt.total_seconds() / 86400
+            for row, value in enumerate(days, start=1):
+                if pd.notna(value):
+                    worksheet.write_number(row, idx, value, time_format)
+
+
 def create_excels(backup_df, obj_df, last_backup_df, last_obj_df, execution_df, summary_df, summary_recent_df, largest_backups_df, smallest_backups_df, details_df, merged_counts_df):
     output_folder = 'workbooks'
     output_path = os.path.join(output_folder, 'Backup data overview.xlsx')
@@ -20,7 +39,7 @@ def create_excels(backup_df, obj_df, last_backup_df, last_obj_df, execution_df,
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
 
-    with pd.ExcelWriter(output_path, engine="xlsxwriter", date_format="yyyy-mm-dd") as writer:
+    with pd.ExcelWriter(output_path, engine="xlsxwriter", date_format="yyyy-mm-dd", datetime_format="yyyy-mm-dd") as writer:
         backup_df.to_excel(writer, sheet_name='Backup', index=False)
         obj_df.to_excel(writer, sheet_name='Backup - objects', index=False)
         last_backup_df.to_excel(writer, sheet_name='Last backup', index=False)
@@ -33,6 +52,11 @@ def create_excels(backup_df, obj_df, last_backup_df, last_obj_df, execution_df,
         adjust_column_widths(writer, last_obj_df, 'Last backup - objects')
         adjust_column_widths(writer, execution_df, 'Backup execution')
 
+        write_time_columns(writer, backup_df, 'Backup')
+        write_time_columns(writer, obj_df, 'Backup - objects')
+        write_time_columns(writer, last_backup_df, 'Last backup')
+        write_time_columns(writer, last_obj_df, 'Last backup - objects')
+
     stats_excel(summary_df, summary_recent_df, largest_backups_df, smallest_backups_df, details_df, merged_counts_df)
     format_backup()
     format_execution()
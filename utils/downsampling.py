@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+
+CHART_WIDTH = 1200
+MAX_POINTS = 50_000
+MIN_BUCKETS = 8
+WEBGL_POINTS = 1000
+
+
+def time_buckets(times, buckets):
+    times = times.astype('int64')
+    start, span = times.min(), max(times.max() - times.min(), 1)
+
+    return np.minimum(((times - start) / span * buckets).astype(np.int64), buckets - 1)
+
+
+def downsample(df, x, y, series, width=CHART_WIDTH, max_points=MAX_POINTS):
+    if len(df) <= max_points:
+        return df
+
+    df = df[df[x].notna() & df[y].notna()]
+    if df.empty:
+        return df
+
+    codes, uniques = pd.factorize(df[series])
+    buckets = max(MIN_BUCKETS, min(width, max_points // (2 * max(len(uniques), 1))))
+
+    groups = codes * buckets + time_buckets(df[x].to_numpy(), buckets)
+    order = np.lexsort((df[y].to_numpy(), groups))
+
+    boundaries = groups[order][1:] != groups[order][:-1]
+    first, last = order[np.append(True, boundaries)], order[np.append(boundaries, True)]
+
+    return df.iloc[np.union1d(first, last)]
+
+
+def render_mode(df):
+    return 'webgl' if len(df) > WEBGL_POINTS else 'svg'
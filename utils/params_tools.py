@@ -4,12 +4,13 @@ from datetime import timedelta
 
 def get_month_week(execution):
     month_week = {}
+    years = execution['Start Datetime'].dt.year
 
-    for month, weeks in execution.groupby('Month')['Week Number']:
+    for (year, month), weeks in execution.groupby([years, 'Month'])['Week Number']:
          week_dates = []
          for week in weeks:
-             week_dates.append(week)
-         month_week[month] = sorted(list(set(week_dates)))
+             week_dates.append(int(week))
+         month_week[(int(year), int(month))] = sorted(list(set(week_dates)))
 
     return month_week
 
@@ -0,0 +1,101 @@
+import os
+import json
+import shutil
+import hashlib
+import pandas as pd
+from utils.report_parser import PARSER_VERSION
+
+
+CACHE_DIR = os.environ.get('REPORT_CACHE_DIR', os.path.join('cache', 'reports'))
+CACHE_SIZE = int(os.environ.get('REPORT_CACHE_SIZE_MB', 512)) * 1024 * 1024
+
+FRAMES = ['backup', 'obj', 'execution']
+
+
+def cache_key(data):
+    return hashlib.sha256(f'{PARSER_VERSION}:'.encode() + data).hexdigest()
+
+
+def fingerprint(*parts):
+    return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+
+def load_cached(key):
+    path = os.path.join(CACHE_DIR, key)
+
+    try:
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as file:
+            meta = json.load(file)
+
+        sheets = []
+        for i, sheet in enumerate(meta['sheets']):
+            frames = [pd.read_parquet(os.path.join(path, f'{i}-{name}.parquet')) for name in FRAMES]
+            sheets.append((sheet['name'], (*frames, sheet['errors'])))
+
+        os.utime(path)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    return sheets
+
+
+def store_cached(key, sheets):
+    path = os.path.join(CACHE_DIR, key)
+    tmp_path = f'{path}.tmp'
+
+    try:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+
+        meta = {'parser_version': PARSER_VERSION, 'sheets': []}
+        for i, (sheet_name, (*frames, errors)) in enumerate(sheets):
+            for name, df in zip(FRAMES, frames):
+                df.to_parquet(os.path.join(tmp_path, f'{i}-{name}.parquet'), index=False)
+            meta['sheets'].append({'name': sheet_name, 'errors': errors})
+
+        with open(os.path.join(tmp_path, 'meta.json'), 'w', encoding='utf-8') as file:
+            json.dump(meta, file)
+
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+    except (OSError, ValueError, TypeError, NotImplementedError):
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        return
+
+    evict()
+
+
+def cache_entries():
+    entries = []
+
+    if not os.path.isdir(CACHE_DIR):
+        return entries
+
+    for key in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, key)
+        if key.endswith('.tmp') or not os.path.isdir(path):
+            continue
+        size = sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+        entries.append((os.path.getmtime(path), size, path))
+
+    return sorted(entries)
+
+
+def evict(max_size=CACHE_SIZE):
+    entries = cache_entries()
+    total_size = sum(size for _, size, _ in entries)
+
+    for _, size, path in entries:
+        if total_size <= max_size:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total_size -= size
+
+
+def invalidate(data):
+    shutil.rmtree(os.path.join(CACHE_DIR, cache_key(data)), ignore_errors=True)
+
+
+def clear_cache():
+    for _, _, path in cache_entries():
+        shutil.rmtree(path, ignore_errors=True)
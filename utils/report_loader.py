@@ -0,0 +1,118 @@
+import os
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from openpyxl import load_workbook
+from utils.backup_loader import report_summary, combine
+from utils.execution_loader import get_backup_execution, merge_retry_rows, combine_exec
+from utils.report_parser import parse_rows
+from utils.schema import share_categories
+from utils.report_cache import cache_key, load_cached, store_cached
+
+
+REPORT_FOOTER = "Veeam Backup & Replication"
+REPORT_COLUMNS = 9
+
+PARSE_WORKERS = int(os.environ.get('PARSE_WORKERS', os.cpu_count() or 1))
+
+
+def read_report_rows(sheet):
+    rows = []
+
+    for row in sheet.iter_rows(max_col=REPORT_COLUMNS, values_only=True):
+        if row[0] and isinstance(row[0], str) and REPORT_FOOTER in row[0]:
+            return rows
+        rows.append(row)
+
+    return None
+
+
+def read_sheet_names(data):
+    workbook = load_workbook(BytesIO(data), read_only=True)
+
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+
+def parse_sheet(data, sheet_name):
+    workbook = load_workbook(BytesIO(data), read_only=True)
+
+    try:
+        rows = read_report_rows(workbook[sheet_name])
+    finally:
+        workbook.close()
+
+    if rows is None:
+        return None
+
+    jobs, details, executions, errors = parse_rows(rows)
+    backup, obj = report_summary(jobs, details)
+
+    return backup, obj, get_backup_execution(executions), [str(error) for error in errors]
+
+
+def load_report_data(named_data, workers=PARSE_WORKERS):
+    reports = []
+    parsed = []
+    tasks = []
+
+    for file_name, data in named_data:
+        key = cache_key(data)
+        sheets = load_cached(key)
+
+        if sheets is None:
+            sheets = []
+            parsed.append((key, sheets))
+            tasks += [(sheets, sheet_name, data) for sheet_name in read_sheet_names(data)]
+
+        reports.append((file_name, sheets))
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [executor.submit(parse_sheet, data, sheet_name) for _, sheet_name, data in tasks]
+            results = [future.result() for future in futures]
+    else:
+        results = [parse_sheet(data, sheet_name) for _, sheet_name, data in tasks]
+
+    for (sheets, sheet_name, _), result in zip(tasks, results):
+        if result is not None:
+            sheets.append((sheet_name, result))
+
+    for key, sheets in parsed:
+        store_cached(key, sheets)
+
+    return [(file_name, sheet_name, result) for file_name, sheets in reports for sheet_name, result in sheets]
+
+
+def combine_reports(results):
+    backup_list, obj_list, execution_list = [], [], []
+
+    for backup, obj, execution, _ in results:
+        backup_list.append(backup)
+        obj_list.append(obj)
+        execution_list.append(execution)
+
+    return share_categories([combine(backup_list), combine(obj_list), merge_retry_rows(combine_exec(execution_list))])
+
+
+def read_report_data(source):
+    if isinstance(source, (bytes, bytearray)):
+        return 'report', bytes(source)
+
+    if hasattr(source, 'read'):
+        return getattr(source, 'name', 'report'), source.read()
+
+    with open(source, 'rb') as file:
+        return os.path.basename(source), file.read()
+
+
+def parse_report(source, workers=1):
+    sheets = load_report_data([read_report_data(source)], workers)
+
+    if not sheets:
+        return None
+
+    errors = [f"Sheet '{sheet_name}': {error}" for _, sheet_name, (*_, sheet_errors) in sheets for error in sheet_errors]
+
+    return (*combine_reports([result for _, _, result in sheets]), errors)
@@ -0,0 +1,108 @@
+import re
+from utils.date_parser import parse_header_date
+from utils.schema import BACKUP_SCHEMA, OBJECT_SCHEMA, EXECUTION_SCHEMA, new_columns, append_row
+
+
+PARSER_VERSION = 6
+
+RETRY_PATTERN = re.compile(r'Backup job: (.*?) \(Retry (\d+)\)')
+TIME_PATTERN = re.compile(r"\d{1,2}:\d{2}:\d{2}")
+
+JOB_STATS = {
+    'Success': ('Start Time', 'Total Size', 'Backup Size'),
+    'Warning': ('End Time', 'Data Read', 'Dedupe'),
+    'Error': ('Duration', 'Transferred', 'Compression')
+}
+
+def parse_job_header(text):
+    if "Retry" in text:
+        match = RETRY_PATTERN.search(text)
+        if match:
+            return match.group(1), int(match.group(2))
+    return text.partition("Backup job: ")[2].strip(), None
+
+
+def flush_job(jobs, backup_entry, count):
+    for _ in range(count):
+        append_row(jobs, backup_entry)
+
+
+def parse_rows(rows):
+    jobs = new_columns(BACKUP_SCHEMA)
+    details = new_columns(OBJECT_SCHEMA)
+    executions = new_columns(EXECUTION_SCHEMA)
+    errors = []
+
+    detail_appends = [values.append for values in details.values()]
+
+    backup_entry = dict.fromkeys(BACKUP_SCHEMA)
+    backup_count = 0
+    execution_entry = None
+    backup_column = 'Backup'
+    details_section = False
+
+    for row in rows:
+        first = row[0]
+
+        if first and isinstance(first, str):
+            if "Backup job" in first:
+                flush_job(jobs, backup_entry, backup_count)
+
+                details_section = False
+                job, retry_num = parse_job_header(first)
+                backup_column = 'Backup' if retry_num is None else f'Backup (Retry {retry_num})'
+
+                backup_entry = dict.fromkeys(BACKUP_SCHEMA)
+                backup_entry['Backup Job'] = job
+                backup_entry['Status'] = row[8]
+                backup_count = 0
+
+                execution_entry = {
+                    'Month': None,
+                    'Date': None,
+                    'Week Number': None,
+                    'Day of Week': None,
+                    'Backup Job': job,
+                    'Status': row[8]
+                }
+                continue
+
+            if first in JOB_STATS and not details_section:
+                backup_entry[first] = row[1]
+                for column, value in zip(JOB_STATS[first], row[3:8:2]):
+                    backup_entry[column] = value
+            elif TIME_PATTERN.search(first):
+                try:
+                    parsed_date = parse_header_date(first)
+                except ValueError as e:
+                    errors.append(e)
+                    continue
+
+                backup_entry['Date'] = parsed_date.date()
+                backup_count += 1
+
+                if execution_entry is not None:
+                    month_first_day = parsed_date.replace(day=1)
+                    days_from_first_monday = (parsed_date - month_first_day).days + month_first_day.weekday()
+
+                    execution_entry['Month'] = parsed_date.month
+                    execution_entry['Week Number'] = days_from_first_monday // 7 + 1
+                    execution_entry['Day of Week'] = parsed_date.strftime('%A')
+                    execution_entry['Date'] = parsed_date.date()
+                continue
+            elif first == "Details":
+                details_section = True
+            elif details_section and first != 'Name':
+                values = (backup_entry['Date'], backup_entry['Backup Job'], first, row[1], row[2], row[3], row[7], row[4], row[5], row[6])
+                for append, value in zip(detail_appends, values):
+                    append(value)
+                continue
+
+        if row[2] == "Start time" and row[3] and row[3] != "End time" and execution_entry is not None:
+            execution_entry[backup_column] = row[3]
+            append_row(executions, execution_entry)
+            execution_entry = None
+
+    flush_job(jobs, backup_entry, backup_count)
+
+    return jobs, details, executions, errors
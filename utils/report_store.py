@@ -0,0 +1,277 @@
+import numpy as np
+import pandas as pd
+from utils.backup_loader import combine, get_last_backups, get_job_objects, filter_backups, backup_days
+from utils.execution_loader import sort_exec, merge_retry_rows
+from utils.report_cache import cache_key, fingerprint
+from utils.report_loader import load_report_data, PARSE_WORKERS
+from utils.report_warehouse import warehouse_lock, remove_tables, append_rows, query, write_table, has_table, read_table, write_keys, read_keys, write_meta, read_meta
+from utils.schema import BACKUP_SCHEMA, OBJECT_SCHEMA, concat_frames
+
+
+WAREHOUSE_VERSION = 2
+
+BACKUP_KEY = ['Date', 'Backup Job', 'Start Time']
+OBJECT_KEY = ['Date', 'Backup Job', 'Start Time', 'Object']
+EXECUTION_KEY = ['Start Datetime', 'Backup Job']
+
+BACKUP_ORDER = ['Date', 'Start Time']
+EXECUTION_ORDER = ['Start Datetime']
+
+PARTITIONED = ['backup', 'obj']
+KEYED = ['backup', 'obj', 'execution_log']
+DAYS = ['backup_days', 'obj_days']
+SNAPSHOTS = ['backup_tail', 'obj_tail', 'execution_log', 'execution', 'latest_backup', 'latest_obj', 'last_backup', 'last_obj'] + DAYS
+
+
+def key_hashes(df, columns):
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+def unseen_keys(index, hashes):
+    unseen = ~pd.Index(hashes).duplicated()
+
+    if len(index):
+        positions = np.minimum(np.searchsorted(index, hashes), len(index) - 1)
+        unseen &= index[positions] != hashes
+
+    return unseen
+
+
+def add_keys(index, hashes):
+    hashes = np.sort(hashes)
+
+    return np.insert(index, np.searchsorted(index, hashes), hashes)
+
+
+def in_order(df, new, columns):
+    return df.empty or new.empty or tuple(new[columns].iloc[0]) >= tuple(df[columns].iloc[-1])
+
+
+def concat_rows(df, new):
+    if df.empty:
+        return new.reset_index(drop=True)
+
+    if new.empty:
+        return df
+
+    return concat_frames([df, new]).reset_index(drop=True)
+
+
+def new_store(backup, obj, execution):
+    keys = np.empty(0, dtype=np.uint64)
+    days = backup_days(backup.iloc[0:0], obj.iloc[0:0])
+
+    return {
+        'fingerprint': None,
+        'files': set(),
+        'job_obj': {},
+        'rows': dict.fromkeys(PARTITIONED, 0),
+        'min_date': None,
+        'max_date': None,
+        'backup_keys': keys,
+        'obj_keys': keys,
+        'execution_log_keys': keys,
+        'backup_tail': backup.iloc[0:0],
+        'obj_tail': obj.iloc[0:0],
+        'execution_log': execution.iloc[0:0],
+        'execution': execution.drop(['Start Datetime'], axis=1).iloc[0:0],
+        'latest_backup': backup.iloc[0:0],
+        'latest_obj': obj.iloc[0:0],
+        'last_backup': backup.iloc[0:0],
+        'last_obj': obj.iloc[0:0],
+        'backup_days': days[0],
+        'obj_days': days[1]
+    }
+
+
+def meta_fingerprint(meta):
+    return meta.get('fingerprint') or fingerprint(meta['files'])
+
+
+def read_store_meta():
+    meta = read_meta()
+
+    return meta if meta is not None and meta.get('version') == WAREHOUSE_VERSION else None
+
+
+def store_changed(store):
+    meta = read_store_meta()
+
+    return meta is None or meta_fingerprint(meta) != store['fingerprint']
+
+
+def open_store():
+    meta = read_store_meta()
+
+    if meta is None:
+        return None
+
+    store = {
+        'fingerprint': meta_fingerprint(meta),
+        'files': set(meta['files']),
+        'job_obj': meta['job_obj'],
+        'rows': meta['rows'],
+        'min_date': pd.Timestamp(meta['min_date']),
+        'max_date': pd.Timestamp(meta['max_date'])
+    }
+
+    for name in KEYED:
+        store[f'{name}_keys'] = read_keys(name)
+
+    for name in SNAPSHOTS:
+        if has_table(name):
+            store[name] = read_table(name)
+
+    if any(name not in store for name in DAYS):
+        store['backup_days'], store['obj_days'] = backup_days(*load_backups())
+
+    return store
+
+
+def save_store(store):
+    store['fingerprint'] = fingerprint(sorted(store['files']))
+
+    for name in KEYED:
+        write_keys(name, store[f'{name}_keys'])
+
+    for name in SNAPSHOTS:
+        write_table(name, store[name])
+
+    write_meta({
+        'version': WAREHOUSE_VERSION,
+        'fingerprint': store['fingerprint'],
+        'files': sorted(store['files']),
+        'job_obj': store['job_obj'],
+        'rows': store['rows'],
+        'min_date': store['min_date'].isoformat(),
+        'max_date': store['max_date'].isoformat()
+    })
+
+
+def load_backups(start=None, end=None, jobs=None):
+    return query('backup', BACKUP_ORDER, BACKUP_SCHEMA, start, end, jobs), query('obj', BACKUP_ORDER, OBJECT_SCHEMA, start, end, jobs)
+
+
+def dedupe(store, name, new, key):
+    hashes = key_hashes(new, key)
+    unseen = unseen_keys(store[f'{name}_keys'], hashes)
+    store[f'{name}_keys'] = add_keys(store[f'{name}_keys'], hashes[unseen])
+
+    return new[unseen]
+
+
+def append_table(store, name, new, key):
+    new = dedupe(store, name, new, key)
+    tail = store[f'{name}_tail']
+    ordered = in_order(tail, new, BACKUP_ORDER)
+
+    if not new.empty:
+        append_rows(name, new, store['rows'][name])
+        store['rows'][name] += len(new)
+
+        if in_order(tail, new.iloc[-1:], BACKUP_ORDER):
+            store[f'{name}_tail'] = new.iloc[-1:].reset_index(drop=True)
+
+    return new, ordered
+
+
+def append_execution_log(store, new):
+    new = dedupe(store, 'execution_log', new, EXECUTION_KEY)
+    ordered = in_order(store['execution_log'], new, EXECUTION_ORDER)
+    store['execution_log'] = concat_rows(store['execution_log'], new)
+
+    if not ordered:
+        store['execution_log'] = store['execution_log'].sort_values(EXECUTION_ORDER, kind='stable', ignore_index=True)
+
+    return new, ordered
+
+
+def update_execution(store, new, ordered):
+    first_rows = new.drop_duplicates('Backup Job')
+    continued = first_rows['Backup'].isna() & first_rows['Backup Job'].isin(store['execution']['Backup Job'])
+
+    if ordered and not continued.any():
+        if not new.empty:
+            store['execution'] = concat_rows(store['execution'], merge_retry_rows(new.drop(['Start Datetime'], axis=1)))
+    else:
+        store['execution'] = merge_retry_rows(store['execution_log'].drop(['Start Datetime'], axis=1))
+
+
+def update_last_backups(store, new_backup, new_obj, ordered):
+    if ordered:
+        latest_obj = concat_rows(store['latest_obj'], new_obj)
+        latest_backup = concat_rows(store['latest_backup'], new_backup)
+    else:
+        latest_backup, latest_obj = load_backups()
+
+    latest_obj = latest_obj.drop_duplicates(['Backup Job', 'Object'], keep='last')
+    latest_backup = filter_backups(latest_backup, latest_obj)
+
+    store['latest_backup'], store['latest_obj'] = latest_backup, latest_obj
+    store['last_backup'], store['last_obj'] = get_last_backups(latest_backup, latest_obj)
+
+
+def update_job_objects(store, new_obj, ordered):
+    if not ordered:
+        store['job_obj'] = get_job_objects(load_backups()[1])
+        return
+
+    for job, objects in get_job_objects(new_obj).items():
+        known = store['job_obj'].setdefault(job, [])
+        seen = set(known)
+        known += [obj for obj in objects if obj not in seen]
+
+
+def update_backup_days(store, new_backup, new_obj):
+    for name, new in zip(DAYS, backup_days(new_backup, new_obj)):
+        store[name] = concat_rows(store[name], new).drop_duplicates(ignore_index=True)
+
+
+def update_date_range(store, new_backup):
+    if new_backup.empty:
+        return
+
+    dates = [new_backup['Date'].iloc[0], new_backup['Date'].iloc[-1]]
+    if store['min_date'] is not None:
+        dates += [store['min_date'], store['max_date']]
+
+    store['min_date'], store['max_date'] = min(dates), max(dates)
+
+
+def append_reports(store, results):
+    backup_list, obj_list, execution_list = zip(*[result[:3] for result in results])
+    backup, obj, execution = combine(backup_list), combine(obj_list), sort_exec(execution_list)
+
+    if store is None:
+        store = new_store(backup, obj, execution)
+
+    new_backup, backup_ordered = append_table(store, 'backup', backup, BACKUP_KEY)
+    new_obj, obj_ordered = append_table(store, 'obj', obj, OBJECT_KEY)
+    new_execution, execution_ordered = append_execution_log(store, execution)
+
+    update_execution(store, new_execution, execution_ordered)
+    update_last_backups(store, new_backup, new_obj, backup_ordered and obj_ordered)
+    update_job_objects(store, new_obj, obj_ordered)
+    update_backup_days(store, new_backup, new_obj)
+    update_date_range(store, new_backup)
+
+    return store
+
+
+def ingest_reports(named_data, workers=PARSE_WORKERS):
+    with warehouse_lock():
+        store = open_store()
+        if store is None:
+            remove_tables()
+
+        files = set() if store is None else store['files']
+        named_data = [(file_name, data) for file_name, data in named_data if cache_key(data) not in files]
+        sheets = load_report_data(named_data, workers)
+
+        if sheets:
+            store = append_reports(store, [result for _, _, result in sheets])
+            reported = {file_name for file_name, _, _ in sheets}
+            store['files'] |= {cache_key(data) for file_name, data in named_data if file_name in reported}
+            save_store(store)
+
+    return store, sheets
@@ -0,0 +1,198 @@
+import os
+import json
+import uuid
+import shutil
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from contextlib import contextmanager
+from utils.schema import concat_frames, empty_frame, sort_categories
+
+try:
+    import fcntl
+except ImportError:
+    import msvcrt
+    fcntl = None
+
+
+WAREHOUSE_DIR = os.environ.get('REPORT_WAREHOUSE_DIR', os.path.join('data', 'warehouse'))
+MAX_PARTITION_FILES = int(os.environ.get('REPORT_WAREHOUSE_MAX_FILES', 4))
+
+SEQUENCE = 'Row'
+PARTITIONS = ['month']
+
+LOCK_FILE = '.lock'
+
+
+def warehouse_path(*names):
+    return os.path.join(WAREHOUSE_DIR, *names)
+
+
+def write_atomic(path, write):
+    tmp_path = os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.tmp')
+
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def lock_file(file):
+    if fcntl is not None:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        return
+
+    file.seek(0)
+    while True:
+        try:
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def unlock_file(file):
+    if fcntl is not None:
+        fcntl.flock(file, fcntl.LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def warehouse_lock():
+    os.makedirs(WAREHOUSE_DIR, exist_ok=True)
+
+    with open(warehouse_path(LOCK_FILE), 'a+') as file:
+        lock_file(file)
+        try:
+            yield
+        finally:
+            unlock_file(file)
+
+
+def partition_path(table, month):
+    return warehouse_path(table, f'month={month}')
+
+
+def compact_partition(path):
+    files = sorted(name for name in os.listdir(path) if name.endswith('.parquet'))
+
+    if len(files) <= MAX_PARTITION_FILES:
+        return
+
+    df = concat_frames(pd.read_parquet(os.path.join(path, name)) for name in files)
+    write_atomic(os.path.join(path, f'{uuid.uuid4().hex}.parquet'), lambda tmp_path: df.to_parquet(tmp_path, index=False))
+
+    for name in files:
+        os.remove(os.path.join(path, name))
+
+
+def append_rows(table, df, start_row, date_column='Date'):
+    df = df.assign(**{SEQUENCE: np.arange(start_row, start_row + len(df))})
+    file_name = f'{uuid.uuid4().hex}.parquet'
+
+    for month, rows in df.groupby(df[date_column].dt.strftime('%Y-%m'), sort=False):
+        path = partition_path(table, month)
+        os.makedirs(path, exist_ok=True)
+        write_atomic(os.path.join(path, file_name), lambda tmp_path: rows.to_parquet(tmp_path, index=False))
+        compact_partition(path)
+
+
+def query(table, order, schema, start=None, end=None, jobs=None, date_column='Date'):
+    path = warehouse_path(table)
+
+    if not os.path.isdir(path):
+        return empty_frame(schema)
+
+    filters = []
+
+    if start is not None:
+        filters += [pc.field('month') >= start.strftime('%Y-%m'), pc.field(date_column) >= start]
+
+    if end is not None:
+        filters += [pc.field('month') <= end.strftime('%Y-%m'), pc.field(date_column) <= end]
+
+    if jobs is not None:
+        filters.append(pc.field('Backup Job').isin(pa.array([str(job) for job in jobs], pa.string())))
+
+    expression = None
+    for condition in filters:
+        expression = condition if expression is None else expression & condition
+
+    df = pd.read_parquet(path, filters=expression).drop(PARTITIONS, axis=1)
+    sort_categories(df)
+    df = df.sort_values(order + [SEQUENCE], kind='stable', ignore_index=True)
+
+    return df.drop(SEQUENCE, axis=1)
+
+
+def write_table(name, df):
+    os.makedirs(WAREHOUSE_DIR, exist_ok=True)
+    write_atomic(warehouse_path(f'{name}.parquet'), lambda tmp_path: df.to_parquet(tmp_path, index=False))
+
+
+def has_table(name):
+    return os.path.exists(warehouse_path(f'{name}.parquet'))
+
+
+def read_table(name):
+    return pd.read_parquet(warehouse_path(f'{name}.parquet'))
+
+
+def write_keys(name, keys):
+    os.makedirs(WAREHOUSE_DIR, exist_ok=True)
+
+    def write(tmp_path):
+        with open(tmp_path, 'wb') as file:
+            np.save(file, keys)
+
+    write_atomic(warehouse_path(f'{name}.keys.npy'), write)
+
+
+def read_keys(name):
+    return np.load(warehouse_path(f'{name}.keys.npy'))
+
+
+def write_meta(meta):
+    os.makedirs(WAREHOUSE_DIR, exist_ok=True)
+
+    def write(tmp_path):
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(meta, file)
+
+    write_atomic(warehouse_path('meta.json'), write)
+
+
+def read_meta():
+    try:
+        with open(warehouse_path('meta.json'), encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def remove_tables():
+    if not os.path.isdir(WAREHOUSE_DIR):
+        return
+
+    for name in os.listdir(WAREHOUSE_DIR):
+        path = warehouse_path(name)
+
+        if name == LOCK_FILE:
+            continue
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            os.remove(path)
+
+
+def clear_warehouse():
+    if not os.path.isdir(WAREHOUSE_DIR):
+        return
+
+    with warehouse_lock():
+        remove_tables()
@@ -0,0 +1,149 @@
+import pandas as pd
+from pandas.api.types import union_categoricals, is_timedelta64_dtype
+
+
+DAY_OF_WEEK = pd.CategoricalDtype(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'], ordered=True)
+
+SHARED_CATEGORIES = ['Backup Job', 'Status']
+
+TIME_PATTERN = r'(\d{1,2}:\d{2}:\d{2})'
+TIME_TYPE = 'timedelta64[ns]'
+
+BACKUP_SCHEMA = {
+    'Date': 'datetime64[ns]',
+    'Backup Job': 'category',
+    'Status': 'category',
+    'Success': 'int64',
+    'Warning': 'int64',
+    'Error': 'int64',
+    'Start Time': TIME_TYPE,
+    'End Time': TIME_TYPE,
+    'Duration': TIME_TYPE,
+    'Total Size': 'string',
+    'Backup Size': 'string',
+    'Data Read': 'string',
+    'Transferred': 'string',
+    'Dedupe': 'string',
+    'Compression': 'string'
+}
+
+OBJECT_SCHEMA = {
+    'Date': 'datetime64[ns]',
+    'Backup Job': 'category',
+    'Object': 'category',
+    'Status': 'category',
+    'Start Time': TIME_TYPE,
+    'End Time': TIME_TYPE,
+    'Duration': TIME_TYPE,
+    'Size': 'string',
+    'Read': 'string',
+    'Transferred': 'string'
+}
+
+EXECUTION_SCHEMA = {
+    'Month': 'int64',
+    'Date': 'datetime64[ns]',
+    'Week Number': 'int64',
+    'Day of Week': DAY_OF_WEEK,
+    'Backup Job': 'category',
+    'Status': 'category'
+}
+
+BACKUP_TIME_TYPE = 'string'
+
+
+def empty_frame(schema):
+    return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in schema.items()})
+
+
+def new_columns(schema):
+    return {column: [] for column in schema}
+
+
+def append_row(columns, entry):
+    size = len(next(iter(columns.values())))
+
+    for column, values in columns.items():
+        values.append(entry.get(column))
+
+    for column, value in entry.items():
+        if column not in columns:
+            columns[column] = [None] * size + [value]
+
+
+def parse_times(values):
+    times = pd.Series(values, dtype=object).astype(str).str.extract(TIME_PATTERN, expand=False)
+
+    return pd.to_timedelta(times, errors='coerce').astype(TIME_TYPE)
+
+
+def time_strings(values):
+    codes, uniques = pd.factorize(values)
+    seconds = uniques.total_seconds()
+    strings = [f"{int(second) // 3600:02d}:{int(second) // 60 % 60:02d}:{int(second) % 60:02d}" for second in seconds]
+
+    return pd.array(strings, dtype='string').take(codes, allow_fill=True)
+
+
+def format_times(df):
+    return df.assign(**{column: time_strings(df[column]) for column in df.columns if is_timedelta64_dtype(df[column])})
+
+
+def convert_column(values, dtype):
+    if dtype == TIME_TYPE and is_timedelta64_dtype(values):
+        return values.astype(TIME_TYPE).array
+
+    codes, uniques = pd.factorize(values)
+    converted = parse_times(uniques) if dtype == TIME_TYPE else pd.Series(uniques).astype(dtype)
+
+    return converted.array.take(codes, allow_fill=True)
+
+
+def apply_schema(df, schema, default=None):
+    columns = {}
+
+    for column in df.columns:
+        dtype = schema.get(column, default)
+        columns[column] = df[column] if dtype is None else convert_column(df[column], dtype)
+
+    return pd.DataFrame(columns, index=df.index)
+
+
+def union_dtype(values):
+    dtypes = {value.dtype for value in values}
+
+    if len(dtypes) == 1:
+        return dtypes.pop()
+
+    return pd.CategoricalDtype(union_categoricals(values, sort_categories=True).categories)
+
+
+def concat_frames(dfs):
+    dfs = list(dfs)
+    categories = {}
+
+    for column in dfs[0].columns:
+        if isinstance(dfs[0][column].dtype, pd.CategoricalDtype):
+            categories[column] = union_dtype([df[column] for df in dfs if column in df.columns])
+
+    return pd.concat([df.astype({column: dtype for column, dtype in categories.items() if column in df.columns}) for df in dfs])
+
+
+def share_categories(dfs, columns=SHARED_CATEGORIES):
+    for column in columns:
+        dtype = union_dtype([df[column] for df in dfs])
+        dfs = [df if df[column].dtype == dtype else df.astype({column: dtype}) for df in dfs]
+
+    return dfs
+
+
+def remove_unused_categories(df):
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].cat.remove_unused_categories()
+
+
+def sort_categories(df):
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].cat.reorder_categories(df[column].cat.categories.sort_values())
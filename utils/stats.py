@@ -1,9 +1,8 @@
 import pandas as pd
-from datetime import datetime
 from openpyxl import load_workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from utils.data_processing import process_data
+from utils.data_processing import process_data, combine_datetime
 
 
 def generate_summary(df):
@@ -80,13 +79,13 @@ def stats(backup_df, obj_df, last_backup_df, last_obj_df):
     general_summary_for_recent_backups = generate_summary(last_backup_df)
     summary_recent_df = pd.DataFrame(list(general_summary_for_recent_backups.items()), columns=['Metric', 'Value'])
 
-    df_grouped = last_obj_df.groupby('Object').last().reset_index()
-    obj_count = obj_df.groupby('Object').size().reset_index(name='Count')
+    df_grouped = last_obj_df.groupby('Object', observed=True).last().reset_index()
+    obj_count = obj_df.groupby('Object', observed=True).size().reset_index(name='Count')
 
     df_sorted = df_grouped.sort_values(by='Object').reset_index(drop=True)
     obj_count_sorted = obj_count.sort_values(by='Object').reset_index(drop=True)
 
-    df_sorted['Datetime'] = df_sorted.apply(lambda row: datetime.combine(pd.to_datetime(row['Date']), pd.to_datetime(row['Start Time'], format='%H:%M:%S').time()), axis=1)
+    df_sorted['Datetime'] = combine_datetime(df_sorted['Date'], df_sorted['Start Time'])
 
     details = {
         'Machine': df_sorted['Object'],
@@ -97,8 +96,8 @@ def stats(backup_df, obj_df, last_backup_df, last_obj_df):
 
     df_details = pd.DataFrame(details)
 
-    total_counts = obj_df.groupby('Object').size().reset_index(name='Backup Count')
-    error_counts = obj_df[obj_df['Status'] == 'Error'].groupby('Object').size().reset_index(name='Error Count')
+    total_counts = obj_df.groupby('Object', observed=True).size().reset_index(name='Backup Count')
+    error_counts = obj_df[obj_df['Status'] == 'Error'].groupby('Object', observed=True).size().reset_index(name='Error Count')
     merged_counts = pd.merge(total_counts, error_counts, on='Object', how='left')
     merged_counts['Error Count'] = merged_counts['Error Count'].fillna(0)
     merged_counts['Error Rate'] = merged_counts['Error Count'] / merged_counts['Backup Count']